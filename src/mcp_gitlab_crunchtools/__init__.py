@@ -22,7 +22,13 @@ Example with Claude Code:
 """
 
 import argparse
+import asyncio
+import contextlib
+from collections.abc import Coroutine
+from typing import Any, Literal
 
+from .client import get_client
+from .errors import ConfigurationError
 from .server import mcp
 
 __version__ = "0.4.1"
@@ -52,6 +58,33 @@ def main() -> None:
     args = parser.parse_args()
 
     if args.transport == "stdio":
-        mcp.run()
+        _run(mcp.run_async(transport="stdio"))
     else:
-        mcp.run(transport=args.transport, host=args.host, port=args.port)
+        _run(_serve_http(args.transport, args.host, args.port))
+
+
+def _run(main: Coroutine[Any, Any, None]) -> None:
+    """Run the server on uvloop when the optional extra is installed.
+
+    Falls back to the default asyncio event loop otherwise (including on
+    Windows, where uvloop is unavailable).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main)
+    else:
+        uvloop.run(main)
+
+
+async def _serve_http(
+    transport: Literal["sse", "streamable-http"], host: str, port: int
+) -> None:
+    """Warm the GitLab connection pool, then serve an HTTP transport.
+
+    Both run on the same event loop so the server reuses the warmed client.
+    Configuration errors are left for the first tool call to report.
+    """
+    with contextlib.suppress(ConfigurationError):
+        await get_client().warmup()
+    await mcp.run_async(transport=transport, host=host, port=port)
@@ -4,10 +4,19 @@ This module provides a secure async HTTP client for the GitLab REST API v4.
 All requests go through this client to ensure consistent security practices.
 """
 
+import asyncio
 import logging
+import random
+import string
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Callable
 from typing import Any
+from urllib.parse import parse_qs, urlsplit
+from weakref import WeakKeyDictionary
 
 import httpx
+import orjson
 
 from .config import get_config
 from .errors import (
@@ -15,12 +24,88 @@ from .errors import (
     PermissionDeniedError,
     ProjectNotFoundError,
     RateLimitError,
+    UserError,
 )
 
 logger = logging.getLogger(__name__)
 
+_jitter = random.SystemRandom()
+
 MAX_RESPONSE_SIZE = 10 * 1024 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+UNBOUNDED_BODY_EXTENSION = "mcp_gitlab.unbounded_body"
 REQUEST_TIMEOUT = 30.0
+MAX_CONNECTIONS = 1000
+MAX_KEEPALIVE_CONNECTIONS = 100
+KEEPALIVE_EXPIRY = 30.0
+MAX_PER_PAGE = 100
+DEFAULT_PAGE_CONCURRENCY = 8
+MAX_LIST_PAGES = 50
+RESPONSE_CACHE_SIZE = 512
+RESPONSE_CACHE_BYTES = 64 * 1024 * 1024
+MAX_CACHED_BODY_SIZE = 1024 * 1024
+STABLE_CACHE_TTL = 600.0
+DEFAULT_CACHE_TTL = 30.0
+VOLATILE_CACHE_TTL = 5.0
+IMMUTABLE_CACHE_TTL = 86400.0
+MAX_IMMUTABLE_BODY_SIZE = 256 * 1024
+COMMIT_SHA_LENGTHS = (40, 64)
+HEX_DIGITS = frozenset(string.hexdigits)
+RATE_LIMIT_PERIOD = 60.0
+MAX_RETRIES = 3
+RETRY_BACKOFF_BASE = 0.5
+MAX_RETRY_DELAY = 30.0
+IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+
+CacheKey = tuple[str, tuple[tuple[str, Any], ...]]
+CacheEntry = tuple[str | None, dict[str, Any], float, int]
+
+PAGINATION_HEADERS = (
+    ("x-total", "total"),
+    ("x-total-pages", "total_pages"),
+    ("x-page", "page"),
+    ("x-per-page", "per_page"),
+    ("x-next-page", "next_page"),
+    ("x-prev-page", "prev_page"),
+)
+
+STATUS_ERRORS: dict[int, Callable[[str, dict[str, str]], UserError]] = {
+    401: lambda _msg, _headers: PermissionDeniedError("Valid Personal Access Token"),
+    403: lambda _msg, _headers: PermissionDeniedError("Required permission scope"),
+    404: lambda msg, _headers: ProjectNotFoundError(msg),
+    429: lambda _msg, headers: RateLimitError(
+        int(headers["retry-after"]) if headers.get("retry-after", "").isdigit() else None
+    ),
+}
+
+
+class _RateLimiter:
+    """Leaky-bucket limit on outbound requests, allowing bursts up to max_rate.
+
+    Timing uses time.monotonic and asyncio.sleep rather than a stored event
+    loop, so a client holding the limiter never keeps a finished loop alive.
+    """
+
+    __slots__ = ("_last_check", "_level", "_max_rate", "_rate_per_sec")
+
+    def __init__(self, max_rate: float, time_period: float) -> None:
+        """Allow max_rate acquisitions per time_period seconds."""
+        self._max_rate = max_rate
+        self._rate_per_sec = max_rate / time_period
+        self._level = 0.0
+        self._last_check = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until the bucket has room for one more request, then take it."""
+        while True:
+            now = time.monotonic()
+            drained = (now - self._last_check) * self._rate_per_sec
+            self._level = max(self._level - drained, 0.0)
+            self._last_check = now
+            if self._level + 1 <= self._max_rate:
+                self._level += 1
+                return
+            await asyncio.sleep((self._level + 1 - self._max_rate) / self._rate_per_sec)
 
 
 class GitLabClient:
@@ -31,18 +116,61 @@ class GitLabClient:
     - Token passed via PRIVATE-TOKEN header (not URL)
     - TLS certificate validation (httpx default)
     - Request timeout enforcement
+    - Pooled keep-alive connections with HTTP/2 multiplexing
     - Response size limits
     - Pagination support via GitLab headers
+    - Short-lived response cache with ETag revalidation for GET requests
+    - Concurrent identical GET requests coalesced into one upstream call
+    - Client-side rate limiting to stay under GitLab's request quota
+    - Bounded number of concurrent outbound requests
+    - Bounded retries for rate-limited and transient failures
     """
 
+    __slots__ = (
+        "_cache_bytes",
+        "_cache_stats",
+        "_client",
+        "_concurrency",
+        "_config",
+        "_generation",
+        "_inflight",
+        "_limiter",
+        "_response_cache",
+    )
+
     def __init__(self) -> None:
         """Initialize the GitLab client."""
         self._config = get_config()
         self._client: httpx.AsyncClient | None = None
+        self._response_cache: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self._cache_bytes = 0
+        self._inflight: dict[CacheKey, asyncio.Future[dict[str, Any]]] = {}
+        self._cache_stats: Counter[str] = Counter()
+        self._generation = 0
+        self._limiter = _RateLimiter(self._config.rate_limit, RATE_LIMIT_PERIOD)
+        self._concurrency = asyncio.Semaphore(self._config.max_concurrency)
+
+    def _build_transport(self, limits: httpx.Limits) -> httpx.AsyncBaseTransport | None:
+        """Build an aiohttp-backed transport when the optional extra is installed.
+
+        Returns None to fall back to httpx's default HTTP/2-capable transport.
+        """
+        try:
+            from httpx_aiohttp import AiohttpTransport
+        except ImportError:
+            return None
+
+        logger.debug("Using aiohttp transport (HTTP/1.1 only)")
+        return AiohttpTransport(verify=self._config.ssl_verify, limits=limits)
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the async HTTP client."""
         if self._client is None:
+            limits = httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            )
             self._client = httpx.AsyncClient(
                 base_url=self._config.api_base_url,
                 headers={
@@ -50,10 +178,26 @@ class GitLabClient:
                     "Content-Type": "application/json",
                 },
                 timeout=httpx.Timeout(REQUEST_TIMEOUT),
+                limits=limits,
+                http2=True,
                 verify=self._config.ssl_verify,
+                transport=self._build_transport(limits),
+                event_hooks={"response": [_reject_oversized_response]},
             )
         return self._client
 
+    async def warmup(self) -> None:
+        """Open a pooled connection before the first tool call.
+
+        Issues a cheap authenticated request so DNS, TCP and TLS setup are
+        paid at startup. Failures are logged, not raised, so an unreachable
+        instance does not stop the server from starting.
+        """
+        try:
+            await self.get("/version")
+        except UserError as e:
+            logger.warning("GitLab connection warmup failed: %s", e)
+
     async def close(self) -> None:
         """Close the HTTP client."""
         if self._client is not None:
@@ -83,79 +227,321 @@ class GitLabClient:
             RateLimitError: On rate limiting
             PermissionDeniedError: On authorization failures
         """
+        if method != "GET":
+            body = await self._fetch(method, path, params=params, json_data=json_data)
+            self._expire_cached()
+            return body
+
+        cache_key = (path, tuple(sorted((params or {}).items())))
+        cached_body = self._fresh_cached(cache_key)
+        if cached_body is not None:
+            self._cache_stats["hits"] += 1
+            return cached_body
+
+        generation = self._generation
+        task = self._inflight.get(cache_key)
+        if task is not None:
+            self._cache_stats["coalesced"] += 1
+        else:
+            self._cache_stats["misses"] += 1
+            task = asyncio.ensure_future(
+                self._fetch(method, path, params=params, cache_key=cache_key)
+            )
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda done: self._forget_inflight(cache_key, done))
+        body = await asyncio.shield(task)
+        if generation != self._generation:
+            # The fetch straddled a write; prefer the entry that write seeded.
+            return self._fresh_cached(cache_key) or body
+        return body
+
+    async def _fetch(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+        cache_key: CacheKey | None = None,
+    ) -> dict[str, Any]:
+        """Send one request and parse its response.
+
+        With a cache_key, a stale cached entry's ETag is sent for
+        revalidation and the parsed body is cached for the next caller,
+        unless a mutation completed while the request was in flight: its
+        body may predate that write and must not replace newer entries.
+        """
+        cached = self._response_cache.get(cache_key) if cache_key is not None else None
+        generation = self._generation
+
         client = await self._get_client()
 
         logger.debug("API request: %s %s", method, path)
 
-        try:
-            response = await client.request(
+        etag = cached[0] if cached is not None else None
+        response, content, _total_bytes = await self._send_with_retry(
+            client,
+            method,
+            path,
+            params=params,
+            json_data=json_data,
+            headers={"If-None-Match": etag} if etag else None,
+        )
+
+        cacheable = cache_key is not None and generation == self._generation
+
+        if cache_key is not None and cached is not None and response.status_code == 304:
+            self._cache_stats["revalidated"] += 1
+            if cacheable:
+                self._store_cached(cache_key, cached[0], cached[1], cached[3])
+            return cached[1]
+
+        headers = dict(response.headers)
+
+        if not response.is_success:
+            self._handle_error_response(response, content, headers)
+
+        body = self._parse_response(response, content, headers)
+
+        if cacheable and cache_key is not None:
+            self._store_cached(cache_key, headers.get("etag"), body, len(content))
+
+        return body
+
+    def _fresh_cached(self, key: CacheKey) -> dict[str, Any] | None:
+        """Return the cached body for key if it has not expired yet."""
+        cached = self._response_cache.get(key)
+        if cached is None or time.monotonic() >= cached[2]:
+            return None
+        self._response_cache.move_to_end(key)
+        return cached[1]
+
+    def _forget_inflight(self, key: CacheKey, task: asyncio.Future[dict[str, Any]]) -> None:
+        """Drop a finished fetch, unless a newer fetch for the key has replaced it."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def _store_cached(
+        self, key: CacheKey, etag: str | None, body: dict[str, Any], size: int
+    ) -> None:
+        """Cache a GET response body until its path's TTL elapses.
+
+        size is the body's length on the wire. Bodies over
+        MAX_CACHED_BODY_SIZE are not cached, and the least recently used
+        entries are evicted to stay within RESPONSE_CACHE_SIZE entries and
+        RESPONSE_CACHE_BYTES bytes. Only bodies up to MAX_IMMUTABLE_BODY_SIZE
+        keep an immutable path's day-long TTL; larger ones get the default.
+        """
+        previous = self._response_cache.pop(key, None)
+        if previous is not None:
+            self._cache_bytes -= previous[3]
+        if size > MAX_CACHED_BODY_SIZE:
+            return
+        ttl = _cache_ttl(key)
+        if ttl == IMMUTABLE_CACHE_TTL and size > MAX_IMMUTABLE_BODY_SIZE:
+            ttl = DEFAULT_CACHE_TTL
+        self._response_cache[key] = (etag, body, time.monotonic() + ttl, size)
+        self._cache_bytes += size
+        while (
+            len(self._response_cache) > RESPONSE_CACHE_SIZE
+            or self._cache_bytes > RESPONSE_CACHE_BYTES
+        ):
+            _evicted_key, evicted = self._response_cache.popitem(last=False)
+            self._cache_bytes -= evicted[3]
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Report how GET requests were served since the client was created.
+
+        hits were answered from a fresh cache entry, coalesced joined an
+        identical request already in flight, and misses went to GitLab;
+        revalidated counts the misses GitLab answered with 304 Not Modified.
+        """
+        hits = self._cache_stats["hits"]
+        coalesced = self._cache_stats["coalesced"]
+        lookups = hits + coalesced + self._cache_stats["misses"]
+        return {
+            "hits": hits,
+            "coalesced": coalesced,
+            "misses": self._cache_stats["misses"],
+            "revalidated": self._cache_stats["revalidated"],
+            "hit_rate": round((hits + coalesced) / lookups, 3) if lookups else 0.0,
+            "entries": len(self._response_cache),
+            "bytes": self._cache_bytes,
+            "inflight": len(self._inflight),
+        }
+
+    def _expire_cached(self) -> None:
+        """Force every cached GET to revalidate after a successful mutation.
+
+        ETags are kept, so unchanged resources still come back as cheap 304s.
+        GETs already in flight may return bodies that predate the mutation:
+        bumping the generation keeps those bodies out of the cache, and
+        forgetting the fetches makes later GETs start their own instead of
+        joining them.
+        """
+        self._generation += 1
+        self._inflight.clear()
+        for key, (etag, body, _expires, size) in list(self._response_cache.items()):
+            self._response_cache[key] = (etag, body, 0.0, size)
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None,
+        json_data: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        tail_bytes: int | None = None,
+    ) -> tuple[httpx.Response, bytearray, int]:
+        """Send a request and stream its body, aborting once it exceeds MAX_RESPONSE_SIZE.
+
+        Declared oversize bodies are rejected by the client's response hook
+        before any bytes are read. Chunked responses carry no content-length,
+        so the limit is also enforced while reading.
+        With tail_bytes, the size limit is lifted and only the body's last
+        tail_bytes are kept, trimmed as chunks arrive.
+        JSON bodies are serialized with orjson; the client's default
+        Content-Type header already declares application/json.
+
+        Returns:
+            The response, the (possibly trimmed) body, and the bytes received
+        """
+        content = bytearray()
+        total_bytes = 0
+        async with self._concurrency:
+            await self._limiter.acquire()
+            async with client.stream(
                 method=method,
                 url=path,
                 params=params,
-                json=json_data,
-            )
-        except httpx.TimeoutException as e:
-            raise GitLabApiError(0, f"Request timeout: {e}") from e
-        except httpx.RequestError as e:
-            raise GitLabApiError(0, f"Request failed: {e}") from e
+                content=orjson.dumps(json_data) if json_data is not None else None,
+                headers=headers,
+                extensions={UNBOUNDED_BODY_EXTENSION: True} if tail_bytes is not None else None,
+            ) as response:
+                async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                    total_bytes += len(chunk)
+                    content += chunk
+                    if tail_bytes is None:
+                        if len(content) > MAX_RESPONSE_SIZE:
+                            raise GitLabApiError(0, "Response too large")
+                    elif len(content) > 2 * tail_bytes:
+                        del content[:-tail_bytes]
+
+        if tail_bytes is not None:
+            del content[:-tail_bytes]
+        return response, content, total_bytes
+
+    async def _send_with_retry(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None,
+        json_data: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        tail_bytes: int | None = None,
+    ) -> tuple[httpx.Response, bytearray, int]:
+        """Send a request, retrying rate-limited and transient failures.
+
+        429 responses are retried for any method, honoring Retry-After.
+        502/503/504 responses and transport errors are retried only for
+        idempotent methods so a POST is never replayed.
+
+        Raises:
+            GitLabApiError: On timeouts or transport errors after the last retry
+        """
+        attempt = 0
+        while True:
+            try:
+                response, content, total_bytes = await self._send(
+                    client,
+                    method,
+                    path,
+                    params=params,
+                    json_data=json_data,
+                    headers=headers,
+                    tail_bytes=tail_bytes,
+                )
+            except httpx.TimeoutException as e:
+                if attempt == MAX_RETRIES or method not in IDEMPOTENT_METHODS:
+                    raise GitLabApiError(0, f"Request timeout: {e}") from e
+                delay = _backoff_delay(attempt)
+            except httpx.RequestError as e:
+                if attempt == MAX_RETRIES or method not in IDEMPOTENT_METHODS:
+                    raise GitLabApiError(0, f"Request failed: {e}") from e
+                delay = _backoff_delay(attempt)
+            else:
+                retry_delay = _retry_delay(method, attempt, response)
+                if retry_delay is None or attempt == MAX_RETRIES:
+                    return response, content, total_bytes
+                delay = retry_delay
 
-        content_length = response.headers.get("content-length")
-        if content_length and int(content_length) > MAX_RESPONSE_SIZE:
-            raise GitLabApiError(0, "Response too large")
+            attempt += 1
+            logger.debug("Retrying %s %s in %.1fs (attempt %d)", method, path, delay, attempt)
+            await asyncio.sleep(delay)
 
-        if not response.is_success:
-            self._handle_error_response(response)
+    def _parse_response(
+        self, response: httpx.Response, content: bytearray, headers: dict[str, str]
+    ) -> dict[str, Any]:
+        """Convert a successful response into the tool result shape.
 
+        ``headers`` is a plain-dict snapshot of the response headers, taken
+        once so repeated lookups avoid httpx's case-insensitive scan.
+        """
         if response.status_code == 204:
             return {"status": "deleted"}
 
-        content_type = response.headers.get("content-type", "")
+        content_type = headers.get("content-type", "")
         if "text/plain" in content_type:
-            return {"content": response.text}
+            return {"content": content.decode(response.encoding or "utf-8", errors="replace")}
 
         try:
-            parsed = response.json()
+            parsed = orjson.loads(content)
         except ValueError as e:
             raise GitLabApiError(
                 response.status_code, f"Invalid JSON response: {e}"
             ) from e
 
         if isinstance(parsed, list):
-            return self._wrap_list_response(parsed, response)
+            return self._wrap_list_response(parsed, headers)
 
         if isinstance(parsed, dict):
             return parsed
         return {"data": parsed}
 
     def _wrap_list_response(
-        self, items: list[Any], response: httpx.Response
+        self, items: list[Any], headers: dict[str, str]
     ) -> dict[str, Any]:
         """Wrap a list response with GitLab pagination headers."""
         wrapped: dict[str, Any] = {"items": items}
 
         pagination: dict[str, Any] = {}
-        for header, key in [
-            ("x-total", "total"),
-            ("x-total-pages", "total_pages"),
-            ("x-page", "page"),
-            ("x-per-page", "per_page"),
-            ("x-next-page", "next_page"),
-            ("x-prev-page", "prev_page"),
-        ]:
-            value = response.headers.get(header)
+        for header, key in PAGINATION_HEADERS:
+            value = headers.get(header)
             if value:
                 pagination[key] = int(value)
 
+        link = headers.get("link", "")
+        if "page_token=" in link and (token := _next_page_token(link)):
+            pagination["next_page_token"] = token
+
         if pagination:
             wrapped["pagination"] = pagination
 
         return wrapped
 
-    def _handle_error_response(self, response: httpx.Response) -> None:
+    def _handle_error_response(
+        self, response: httpx.Response, content: bytearray, headers: dict[str, str]
+    ) -> None:
         """Handle error responses from the API.
 
         Args:
             response: HTTP response
+            content: Response body read by _send
+            headers: Snapshot of the response headers
 
         Raises:
             Various UserError subclasses based on error type
@@ -163,26 +549,21 @@ class GitLabClient:
         status_code = response.status_code
 
         error_msg: str = "Unknown error"
-        try:
-            error_body = response.json()
-            if isinstance(error_body, dict):
-                raw_msg = error_body.get("message", error_body.get("error"))
-                if isinstance(raw_msg, (dict, str, int, float)):
-                    error_msg = str(raw_msg)
-            else:
-                error_msg = str(error_body)
-        except ValueError:
-            error_msg = response.text[:200] if response.text else "Unknown error"
-
-        if status_code == 401:
-            raise PermissionDeniedError("Valid Personal Access Token")
-        if status_code == 403:
-            raise PermissionDeniedError("Required permission scope")
-        if status_code == 404:
-            raise ProjectNotFoundError(error_msg)
-        if status_code == 429:
-            retry_after = response.headers.get("retry-after")
-            raise RateLimitError(int(retry_after) if retry_after else None)
+        if content:
+            try:
+                error_body = orjson.loads(content)
+                if isinstance(error_body, dict):
+                    raw_msg = error_body.get("message", error_body.get("error"))
+                    if isinstance(raw_msg, (dict, str, int, float)):
+                        error_msg = str(raw_msg)
+                else:
+                    error_msg = str(error_body)
+            except ValueError:
+                error_msg = content.decode(response.encoding or "utf-8", errors="replace")[:200]
+
+        error_factory = STATUS_ERRORS.get(status_code)
+        if error_factory is not None:
+            raise error_factory(error_msg, headers)
 
         raise GitLabApiError(status_code, error_msg)
 
@@ -193,6 +574,128 @@ class GitLabClient:
         """Make a GET request."""
         return await self._request("GET", path, params=params)
 
+    async def get_text(self, path: str, params: dict[str, Any] | None = None) -> str | None:
+        """GET a raw resource and return its body if it is text.
+
+        Unlike get(), the body is never parsed as JSON, so any ``text/*``
+        response (including JSON or YAML files served raw) comes back as-is.
+        Responses are not cached.
+
+        Args:
+            path: API path of a raw resource (e.g., a repository file's raw endpoint)
+            params: Query parameters
+
+        Returns:
+            The decoded body, or None if the response is not ``text/*``
+        """
+        client = await self._get_client()
+
+        logger.debug("API request: GET %s (raw)", path)
+
+        response, content, _total_bytes = await self._send_with_retry(
+            client, "GET", path, params=params, json_data=None, headers=None
+        )
+
+        headers = dict(response.headers)
+        if not response.is_success:
+            self._handle_error_response(response, content, headers)
+
+        if not headers.get("content-type", "").startswith("text/"):
+            return None
+        return content.decode(response.encoding or "utf-8", errors="replace")
+
+    async def get_text_tail(self, path: str, max_bytes: int) -> dict[str, Any]:
+        """GET a plain-text resource, keeping only its last ``max_bytes``.
+
+        The body is streamed and trimmed as it arrives, so memory stays
+        bounded by ``max_bytes`` however large the resource is; it is
+        therefore exempt from MAX_RESPONSE_SIZE. Rate-limited and transient
+        failures are retried like any other GET. Responses are not cached.
+
+        Args:
+            path: API path of a plain-text resource (e.g., a job trace)
+            max_bytes: Number of trailing bytes to keep
+
+        Returns:
+            Dictionary with the tail content, total size, and truncation flag
+        """
+        client = await self._get_client()
+
+        logger.debug("API request: GET %s (tail %d bytes)", path, max_bytes)
+
+        response, tail, total_bytes = await self._send_with_retry(
+            client, "GET", path, params=None, json_data=None, headers=None, tail_bytes=max_bytes
+        )
+
+        if not response.is_success:
+            self._handle_error_response(response, tail, dict(response.headers))
+
+        return {
+            "content": tail.decode(response.encoding or "utf-8", errors="replace"),
+            "total_bytes": total_bytes,
+            "truncated": total_bytes > max_bytes,
+        }
+
+    async def get_all_pages(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        max_pages: int = MAX_LIST_PAGES,
+    ) -> dict[str, Any]:
+        """Fetch every page of a list endpoint, up to ``max_pages`` pages.
+
+        The first page is fetched to learn ``x-total-pages``; the remaining
+        pages are then requested in parallel, at most ``concurrency`` at a time.
+        GitLab omits the total for very large collections, in which case the
+        pages are walked sequentially via ``x-next-page``.
+
+        Args:
+            path: API path of a list endpoint
+            params: Query parameters (page and per_page are overridden)
+            concurrency: Maximum number of pages fetched at once
+            max_pages: Stop after this many pages and mark the result truncated
+
+        Returns:
+            Dictionary with all items concatenated in page order
+        """
+        base_params = {**(params or {}), "per_page": MAX_PER_PAGE}
+        first = await self.get(path, {**base_params, "page": 1})
+        items: list[Any] = list(first.get("items", []))
+        pagination = first.get("pagination", {})
+        total_pages = pagination.get("total_pages")
+
+        if total_pages is None:
+            next_page = pagination.get("next_page")
+            fetched = 1
+            while next_page and fetched < max_pages:
+                page = await self.get(path, {**base_params, "page": next_page})
+                items.extend(page.get("items", []))
+                next_page = page.get("pagination", {}).get("next_page")
+                fetched += 1
+            result: dict[str, Any] = {"total": len(items)}
+            if next_page:
+                result["truncated"] = True
+            return {"items": items, "pagination": result}
+
+        last_page = min(total_pages, max_pages)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_page(page_number: int) -> dict[str, Any]:
+            async with semaphore:
+                return await self.get(path, {**base_params, "page": page_number})
+
+        pages = await asyncio.gather(
+            *(fetch_page(number) for number in range(2, last_page + 1))
+        )
+        for page in pages:
+            items.extend(page.get("items", []))
+
+        result = {"total": len(items), "total_pages": total_pages}
+        if last_page < total_pages:
+            result["truncated"] = True
+        return {"items": items, "pagination": result}
+
     async def post(
         self,
         path: str,
@@ -207,20 +710,151 @@ class GitLabClient:
         path: str,
         json_data: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Make a PUT request."""
-        return await self._request("PUT", path, json_data=json_data)
+        """Make a PUT request.
+
+        GitLab answers an issue or merge request update with the record's
+        new state, so that body also seeds the cache for a plain GET of the
+        same path; reading the record back right after updating it then
+        needs no extra request. Other PUT responses (files, labels, ...) do
+        not match their GET shape and only expire the cache.
+        """
+        body = await self._request("PUT", path, json_data=json_data)
+        if _is_record_path(path):
+            self._store_cached((path, ()), None, body, len(orjson.dumps(body)))
+        return body
 
     async def delete(self, path: str) -> dict[str, Any]:
         """Make a DELETE request."""
         return await self._request("DELETE", path)
 
 
-_client: GitLabClient | None = None
+async def _reject_oversized_response(response: httpx.Response) -> None:
+    """Response hook that rejects bodies declared larger than MAX_RESPONSE_SIZE.
+
+    Runs once headers arrive, so httpx closes the stream without
+    downloading the body. Requests that bound their own memory use
+    (see GitLabClient.get_text_tail) opt out via UNBOUNDED_BODY_EXTENSION.
+    """
+    content_length = response.headers.get("content-length")
+    if (
+        content_length
+        and int(content_length) > MAX_RESPONSE_SIZE
+        and not response.request.extensions.get(UNBOUNDED_BODY_EXTENSION)
+    ):
+        raise GitLabApiError(0, "Response too large")
+
+
+def _cache_ttl(key: CacheKey) -> float:
+    """Return how long a cached GET response may be reused without a request.
+
+    Files and trees read at a full commit SHA never change; a single
+    project or group record changes rarely; pipelines and jobs change while
+    they run; everything else (issues, merge requests, project and group
+    lists, search, ...) gets a short default so new records show up soon.
+    """
+    path, params = key
+    segments = path.strip("/").split("/")
+    match segments:
+        case ["projects", _, "repository", "files" | "tree", *_] if _is_commit_sha(
+            dict(params).get("ref")
+        ):
+            return IMMUTABLE_CACHE_TTL
+        case ["projects" | "groups", _]:
+            return STABLE_CACHE_TTL
+        case _ if "pipelines" in segments or "jobs" in segments:
+            return VOLATILE_CACHE_TTL
+        case _:
+            return DEFAULT_CACHE_TTL
+
+
+def _is_record_path(path: str) -> bool:
+    """Whether path is a single issue or merge request, as read by get_issue/get_merge_request."""
+    match path.strip("/").split("/"):
+        case ["projects", _, "issues" | "merge_requests", _]:
+            return True
+        case _:
+            return False
+
+
+def _is_commit_sha(ref: object) -> bool:
+    """Whether ref is a full SHA-1 or SHA-256 commit ID rather than a branch or tag."""
+    return (
+        isinstance(ref, str) and len(ref) in COMMIT_SHA_LENGTHS and HEX_DIGITS.issuperset(ref)
+    )
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Jittered exponential backoff for the given zero-based attempt."""
+    delay: float = min(MAX_RETRY_DELAY, RETRY_BACKOFF_BASE * (2**attempt + _jitter.random()))
+    return delay
+
+
+def _next_page_token(link_header: str) -> str | None:
+    """Extract the keyset page_token from a Link header's rel="next" URL."""
+    for link in link_header.split(","):
+        url, _, rel = link.partition(";")
+        if 'rel="next"' in rel:
+            tokens = parse_qs(urlsplit(url.strip(" <>")).query).get("page_token")
+            return tokens[0] if tokens else None
+    return None
+
+
+def _rate_limit_wait(headers: httpx.Headers) -> float | None:
+    """Seconds GitLab asked us to wait after a 429, if it said.
+
+    Retry-After is preferred; otherwise RateLimit-Reset, an epoch timestamp
+    GitLab sends with its rate-limit headers, gives the exact reset time.
+    """
+    retry_after = headers.get("retry-after", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+    reset = headers.get("ratelimit-reset", "")
+    if reset.isdigit():
+        return max(0.0, int(reset) - time.time())
+    return None
+
+
+def _retry_delay(method: str, attempt: int, response: httpx.Response) -> float | None:
+    """Seconds to wait before retrying a response, or None if it is final."""
+    match response.status_code:
+        case 429:
+            delay = _rate_limit_wait(response.headers)
+            if delay is None:
+                delay = _backoff_delay(attempt)
+            return delay if delay <= MAX_RETRY_DELAY else None
+        case 502 | 503 | 504 if method in IDEMPOTENT_METHODS:
+            return _backoff_delay(attempt)
+        case _:
+            return None
+
+
+_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, GitLabClient] = WeakKeyDictionary()
 
 
 def get_client() -> GitLabClient:
-    """Get the global GitLab client instance."""
-    global _client
-    if _client is None:
-        _client = GitLabClient()
-    return _client
+    """Get the GitLab client for the running event loop.
+
+    httpx connection pools are bound to the loop that created them, so each
+    loop gets its own client. Must be called from within a coroutine.
+    Clients of closed loops are dropped here: open pooled connections can
+    reference their loop and would otherwise keep the weak key alive.
+    """
+    loop = asyncio.get_running_loop()
+    for closed in [other for other in _clients if other.is_closed()]:
+        del _clients[closed]
+    client = _clients.get(loop)
+    if client is None:
+        client = GitLabClient()
+        _clients[loop] = client
+    return client
+
+
+async def close_client() -> None:
+    """Close and forget the GitLab client for the running event loop.
+
+    Called on server shutdown so pooled keep-alive connections are released
+    cleanly instead of being dropped with the loop.
+    """
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
@@ -6,6 +6,7 @@ The token is stored as a SecretStr to prevent accidental logging.
 
 import logging
 import os
+from functools import lru_cache
 from urllib.parse import urlparse
 
 from pydantic import SecretStr
@@ -14,6 +15,47 @@ from .errors import ConfigurationError
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_RATE_LIMIT = 300
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+@lru_cache(maxsize=16)
+def _validate_gitlab_url(url: str) -> str:
+    """Validate a GitLab instance URL and strip any trailing slash.
+
+    Cached because Config is rebuilt with the same URL whenever the
+    singleton is reset.
+
+    Raises:
+        ConfigurationError: If the URL is malformed or not HTTPS for a remote host.
+    """
+    gitlab_url = url.rstrip("/")
+
+    parsed = urlparse(gitlab_url)
+    if not parsed.scheme or not parsed.netloc:
+        raise ConfigurationError(
+            "Invalid GITLAB_URL: must be a valid URL (e.g. https://gitlab.com)"
+        )
+
+    if parsed.scheme != "https" and parsed.hostname not in ("localhost", "127.0.0.1", "::1"):
+        raise ConfigurationError(
+            "GITLAB_URL must use HTTPS for non-localhost URLs"
+        )
+
+    return gitlab_url
+
+
+def _positive_int_env(name: str, default: int, unit: str) -> int:
+    """Read a positive integer setting from the environment.
+
+    Raises:
+        ConfigurationError: If the value is not a positive integer.
+    """
+    value = os.environ.get(name, str(default))
+    if not value.isdigit() or int(value) < 1:
+        raise ConfigurationError(f"{name} must be a positive integer ({unit})")
+    return int(value)
+
 
 class Config:
     """Secure configuration handling.
@@ -22,6 +64,8 @@ class Config:
     via the token property when actually needed for API calls.
     """
 
+    __slots__ = ("_base_url", "_max_concurrency", "_rate_limit", "_ssl_verify", "_token")
+
     def __init__(self) -> None:
         """Initialize configuration from environment variables.
 
@@ -38,20 +82,9 @@ class Config:
 
         self._token = SecretStr(token)
 
-        gitlab_url = os.environ.get("GITLAB_URL", "https://gitlab.com").rstrip("/")
-
-        parsed = urlparse(gitlab_url)
-        if not parsed.scheme or not parsed.netloc:
-            raise ConfigurationError(
-                "Invalid GITLAB_URL: must be a valid URL (e.g. https://gitlab.com)"
-            )
-
-        if parsed.scheme != "https" and parsed.hostname not in ("localhost", "127.0.0.1", "::1"):
-            raise ConfigurationError(
-                "GITLAB_URL must use HTTPS for non-localhost URLs"
-            )
-
-        self._base_url = gitlab_url
+        self._base_url = _validate_gitlab_url(
+            os.environ.get("GITLAB_URL", "https://gitlab.com")
+        )
 
         ssl_disabled = os.environ.get("GITLAB_SSL_VERIFY", "true").lower() in ("false", "0", "no")
         ssl_cert_file = os.environ.get("SSL_CERT_FILE")
@@ -66,6 +99,13 @@ class Config:
             case _:
                 self._ssl_verify = True
 
+        self._rate_limit = _positive_int_env(
+            "GITLAB_RATE_LIMIT", DEFAULT_RATE_LIMIT, "requests per minute"
+        )
+        self._max_concurrency = _positive_int_env(
+            "GITLAB_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY, "requests in flight"
+        )
+
         logger.info("Configuration loaded successfully (GitLab: %s)", self._base_url)
 
     @property
@@ -97,6 +137,16 @@ class Config:
         """
         return self._ssl_verify
 
+    @property
+    def rate_limit(self) -> int:
+        """Maximum outbound API requests per minute."""
+        return self._rate_limit
+
+    @property
+    def max_concurrency(self) -> int:
+        """Maximum outbound API requests in flight at once."""
+        return self._max_concurrency
+
     def __repr__(self) -> str:
         """Safe repr that never exposes the token."""
         return f"Config(gitlab_url={self._base_url}, token=***)"
@@ -33,8 +33,9 @@ class GitLabApiError(UserError):
 
     def __init__(self, code: int, message: str) -> None:
         token = os.environ.get("GITLAB_TOKEN", "")
-        safe_message = message.replace(token, "***") if token else message
-        super().__init__(f"GitLab API error {code}: {safe_message}")
+        if token and token in message:
+            message = message.replace(token, "***")
+        super().__init__(f"GitLab API error {code}: {message}")
 
 
 class ProjectNotFoundError(UserError):
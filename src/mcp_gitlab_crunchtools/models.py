@@ -4,29 +4,26 @@ All tool inputs are validated through these models to prevent injection attacks
 and ensure data integrity before making API calls.
 """
 
-import re
-from urllib.parse import quote
+import string
+from functools import lru_cache
+from typing import Annotated, Literal, get_args
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, model_validator
 
-PROJECT_ID_NUMERIC = re.compile(r"^\d+$")
-PROJECT_PATH_PATTERN = re.compile(r"^[a-zA-Z0-9\-_./]+$")
+PROJECT_PATH_CHARS = frozenset(string.ascii_letters + string.digits + "-_./")
+ENCODED_SLASH = "%2F"
 
 SEARCH_SCOPES = frozenset({
     "projects", "issues", "merge_requests", "milestones",
     "snippet_titles", "wiki_blobs", "commits", "blobs", "notes", "users",
 })
 
-PROJECT_VISIBILITIES = frozenset({"public", "internal", "private"})
+MergeRequestState = Literal["opened", "closed", "merged", "all"]
 
-MR_STATES = frozenset({"opened", "closed", "merged", "all"})
+IssueState = Literal["opened", "closed", "all"]
 
-ISSUE_STATES = frozenset({"opened", "closed", "all"})
-
-PIPELINE_STATUSES = frozenset({
-    "created", "waiting_for_resource", "preparing", "pending",
-    "running", "success", "failed", "canceled", "skipped", "manual", "scheduled",
-})
+OverviewSection = Literal["labels", "milestones", "releases", "branches"]
+OVERVIEW_SECTIONS = get_args(OverviewSection)
 
 MAX_PROJECT_NAME_LENGTH = 255
 MAX_TITLE_LENGTH = 500
@@ -34,12 +31,30 @@ MAX_DESCRIPTION_LENGTH = 50000
 MAX_LABELS_LENGTH = 1000
 MAX_BRANCH_LENGTH = 255
 MAX_ASSIGNEES = 10
-
-
+MAX_BULK_NOTES = 20
+ENCODED_ID_CACHE_SIZE = 2048
+
+Visibility = Literal["public", "internal", "private"]
+StateEvent = Literal["close", "reopen"]
+MilestoneState = Literal["active", "closed", "all"]
+SortOrder = Literal["asc", "desc"]
+FileEncoding = Literal["text", "base64"]
+BranchName = Annotated[str, StringConstraints(min_length=1, max_length=MAX_BRANCH_LENGTH)]
+Title = Annotated[str, StringConstraints(min_length=1, max_length=MAX_TITLE_LENGTH)]
+Description = Annotated[str, StringConstraints(max_length=MAX_DESCRIPTION_LENGTH)]
+Labels = Annotated[str, StringConstraints(max_length=MAX_LABELS_LENGTH)]
+UserIds = Annotated[tuple[int, ...], Field(max_length=MAX_ASSIGNEES)]
+
+
+@lru_cache(maxsize=ENCODED_ID_CACHE_SIZE)
 def encode_project_id(project_id: str) -> str:
     """Validate and encode a project identifier for URL use.
 
     GitLab accepts either numeric IDs or URL-encoded namespace/project paths.
+    Once validated against PROJECT_PATH_CHARS, the slash is the only
+    character that needs percent-encoding.
+    Results are memoized since tools are called repeatedly with the same IDs;
+    invalid identifiers raise on every call.
 
     Args:
         project_id: Numeric ID (e.g., "12345") or path (e.g., "group/project")
@@ -50,23 +65,24 @@ def encode_project_id(project_id: str) -> str:
     Raises:
         ValueError: If the project_id format is invalid
     """
-    if not project_id or not project_id.strip():
+    if project_id and (project_id[0].isspace() or project_id[-1].isspace()):
+        project_id = project_id.strip()
+    if not project_id:
         raise ValueError("project_id must not be empty")
 
-    project_id = project_id.strip()
-
-    if PROJECT_ID_NUMERIC.match(project_id):
+    if project_id.isascii() and project_id.isdigit():
         return project_id
 
-    if not PROJECT_PATH_PATTERN.match(project_id):
+    if not PROJECT_PATH_CHARS.issuperset(project_id):
         raise ValueError(
             "project_id must be a numeric ID or a path like 'group/project' "
             "(alphanumeric, hyphens, underscores, dots, and slashes only)"
         )
 
-    return quote(project_id, safe="")
+    return project_id.replace("/", ENCODED_SLASH)
 
 
+@lru_cache(maxsize=ENCODED_ID_CACHE_SIZE)
 def encode_group_id(group_id: str) -> str:
     """Validate and encode a group identifier for URL use.
 
@@ -79,95 +95,81 @@ def encode_group_id(group_id: str) -> str:
     Raises:
         ValueError: If the group_id format is invalid
     """
-    if not group_id or not group_id.strip():
+    if group_id and (group_id[0].isspace() or group_id[-1].isspace()):
+        group_id = group_id.strip()
+    if not group_id:
         raise ValueError("group_id must not be empty")
 
-    group_id = group_id.strip()
-
-    if PROJECT_ID_NUMERIC.match(group_id):
+    if group_id.isascii() and group_id.isdigit():
         return group_id
 
-    if not PROJECT_PATH_PATTERN.match(group_id):
+    if not PROJECT_PATH_CHARS.issuperset(group_id):
         raise ValueError(
             "group_id must be a numeric ID or a path like 'group/subgroup' "
             "(alphanumeric, hyphens, underscores, dots, and slashes only)"
         )
 
-    return quote(group_id, safe="")
+    return group_id.replace("/", ENCODED_SLASH)
 
 
-class CreateIssueInput(BaseModel):
-    """Validated input for issue creation."""
+class _StrictModel(BaseModel):
+    """Base for tool input models; unknown fields are rejected."""
 
     model_config = ConfigDict(extra="forbid")
 
-    title: str = Field(
-        ..., min_length=1, max_length=MAX_TITLE_LENGTH, description="Issue title"
+
+class _IssueFields(_StrictModel):
+    """Fields shared by issue creation and updates; all optional here."""
+
+    title: Title | None = Field(
+        default=None, description="Issue title"
     )
-    description: str | None = Field(
-        default=None, max_length=MAX_DESCRIPTION_LENGTH, description="Issue description (Markdown)"
+    description: Description | None = Field(
+        default=None, description="Issue description (Markdown)"
     )
-    labels: str | None = Field(
-        default=None, max_length=MAX_LABELS_LENGTH, description="Comma-separated label names"
+    labels: Labels | None = Field(
+        default=None, description="Comma-separated label names"
     )
-    assignee_ids: list[int] | None = Field(
-        default=None, max_length=MAX_ASSIGNEES, description="User IDs to assign"
+    assignee_ids: UserIds | None = Field(
+        default=None, description="User IDs to assign"
     )
     milestone_id: int | None = Field(
         default=None, description="Milestone ID"
     )
+    confidential: bool | None = Field(
+        default=None, description="Whether the issue is confidential"
+    )
+
+
+class CreateIssueInput(_IssueFields):
+    """Validated input for issue creation."""
+
+    title: Title = Field(
+        ..., description="Issue title"
+    )
     confidential: bool = Field(
         default=False, description="Whether the issue is confidential"
     )
 
 
-class UpdateIssueInput(BaseModel):
+class UpdateIssueInput(_IssueFields):
     """Validated input for issue updates."""
 
-    model_config = ConfigDict(extra="forbid")
-
-    title: str | None = Field(
-        default=None, min_length=1, max_length=MAX_TITLE_LENGTH, description="Issue title"
-    )
-    description: str | None = Field(
-        default=None, max_length=MAX_DESCRIPTION_LENGTH, description="Issue description (Markdown)"
-    )
-    labels: str | None = Field(
-        default=None, max_length=MAX_LABELS_LENGTH, description="Comma-separated label names"
-    )
-    state_event: str | None = Field(
+    state_event: StateEvent | None = Field(
         default=None, description="State transition: close or reopen"
     )
-    assignee_ids: list[int] | None = Field(
-        default=None, max_length=MAX_ASSIGNEES, description="User IDs to assign"
-    )
-    milestone_id: int | None = Field(
-        default=None, description="Milestone ID"
-    )
-    confidential: bool | None = Field(
-        default=None, description="Whether the issue is confidential"
-    )
 
-    @field_validator("state_event")
-    @classmethod
-    def validate_state_event(cls, v: str | None) -> str | None:
-        if v is not None and v not in ("close", "reopen"):
-            raise ValueError("state_event must be 'close' or 'reopen'")
-        return v
 
-
-class CreateProjectInput(BaseModel):
+class CreateProjectInput(_StrictModel):
     """Validated input for project creation."""
 
-    model_config = ConfigDict(extra="forbid")
-
     name: str = Field(
         ..., min_length=1, max_length=MAX_PROJECT_NAME_LENGTH, description="Project name"
     )
-    description: str | None = Field(
-        default=None, max_length=MAX_DESCRIPTION_LENGTH, description="Project description"
+    description: Description | None = Field(
+        default=None, description="Project description"
     )
-    visibility: str = Field(
+    visibility: Visibility = Field(
         default="private", description="Visibility level (public, internal, private)"
     )
     initialize_with_readme: bool = Field(
@@ -177,86 +179,63 @@ class CreateProjectInput(BaseModel):
         default=None, description="Namespace ID to create the project under (group or user)"
     )
 
-    @field_validator("visibility")
-    @classmethod
-    def validate_visibility(cls, v: str) -> str:
-        if v not in PROJECT_VISIBILITIES:
-            raise ValueError(
-                f"visibility must be one of: {', '.join(sorted(PROJECT_VISIBILITIES))}"
-            )
-        return v
 
+class _MergeRequestFields(_StrictModel):
+    """Fields shared by merge request creation and updates; all optional here."""
 
-class CreateMergeRequestInput(BaseModel):
-    """Validated input for merge request creation."""
-
-    model_config = ConfigDict(extra="forbid")
-
-    source_branch: str = Field(
-        ..., min_length=1, max_length=MAX_BRANCH_LENGTH, description="Source branch name"
-    )
-    target_branch: str = Field(
-        ..., min_length=1, max_length=MAX_BRANCH_LENGTH, description="Target branch name"
+    title: Title | None = Field(
+        default=None, description="MR title"
     )
-    title: str = Field(
-        ..., min_length=1, max_length=MAX_TITLE_LENGTH, description="MR title"
+    description: Description | None = Field(
+        default=None, description="MR description (Markdown)"
     )
-    description: str | None = Field(
-        default=None, max_length=MAX_DESCRIPTION_LENGTH, description="MR description (Markdown)"
+    labels: Labels | None = Field(
+        default=None, description="Comma-separated label names"
     )
-    labels: str | None = Field(
-        default=None, max_length=MAX_LABELS_LENGTH, description="Comma-separated label names"
+    assignee_ids: UserIds | None = Field(
+        default=None, description="User IDs to assign"
     )
-    assignee_ids: list[int] | None = Field(
-        default=None, max_length=MAX_ASSIGNEES, description="User IDs to assign"
-    )
-    reviewer_ids: list[int] | None = Field(
-        default=None, max_length=MAX_ASSIGNEES, description="User IDs to review"
+    reviewer_ids: UserIds | None = Field(
+        default=None, description="User IDs to review"
     )
     milestone_id: int | None = Field(
         default=None, description="Milestone ID"
     )
-    remove_source_branch: bool = Field(
-        default=False, description="Remove source branch after merge"
+    target_branch: BranchName | None = Field(
+        default=None, description="Target branch"
+    )
+    remove_source_branch: bool | None = Field(
+        default=None, description="Remove source branch after merge"
     )
 
 
-class UpdateMergeRequestInput(BaseModel):
-    """Validated input for merge request updates."""
-
-    model_config = ConfigDict(extra="forbid")
+class CreateMergeRequestInput(_MergeRequestFields):
+    """Validated input for merge request creation."""
 
-    title: str | None = Field(
-        default=None, min_length=1, max_length=MAX_TITLE_LENGTH, description="MR title"
-    )
-    description: str | None = Field(
-        default=None, max_length=MAX_DESCRIPTION_LENGTH, description="MR description (Markdown)"
-    )
-    labels: str | None = Field(
-        default=None, max_length=MAX_LABELS_LENGTH, description="Comma-separated label names"
+    source_branch: BranchName = Field(
+        ..., description="Source branch name"
     )
-    state_event: str | None = Field(
-        default=None, description="State transition: close or reopen"
-    )
-    assignee_ids: list[int] | None = Field(
-        default=None, max_length=MAX_ASSIGNEES, description="User IDs to assign"
-    )
-    reviewer_ids: list[int] | None = Field(
-        default=None, max_length=MAX_ASSIGNEES, description="User IDs to review"
-    )
-    milestone_id: int | None = Field(
-        default=None, description="Milestone ID"
+    target_branch: BranchName = Field(
+        ..., description="Target branch name"
     )
-    target_branch: str | None = Field(
-        default=None, min_length=1, max_length=MAX_BRANCH_LENGTH, description="Target branch"
+    title: Title = Field(
+        ..., description="MR title"
     )
-    remove_source_branch: bool | None = Field(
-        default=None, description="Remove source branch after merge"
+    remove_source_branch: bool = Field(
+        default=False, description="Remove source branch after merge"
     )
 
-    @field_validator("state_event")
-    @classmethod
-    def validate_state_event(cls, v: str | None) -> str | None:
-        if v is not None and v not in ("close", "reopen"):
-            raise ValueError("state_event must be 'close' or 'reopen'")
-        return v
+    @model_validator(mode="after")
+    def _check_distinct_branches(self) -> "CreateMergeRequestInput":
+        """Reject MRs that GitLab would refuse for merging a branch into itself."""
+        if self.source_branch == self.target_branch:
+            raise ValueError("source_branch and target_branch must differ")
+        return self
+
+
+class UpdateMergeRequestInput(_MergeRequestFields):
+    """Validated input for merge request updates."""
+
+    state_event: StateEvent | None = Field(
+        default=None, description="State transition: close or reopen"
+    )
@@ -4,11 +4,26 @@ This module creates and configures the MCP server with all tools.
 """
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 from fastmcp import FastMCP
 
+from .client import close_client
+from .models import (
+    FileEncoding,
+    IssueState,
+    MergeRequestState,
+    MilestoneState,
+    OverviewSection,
+    SortOrder,
+    StateEvent,
+    Visibility,
+)
 from .tools import (
+    bulk_create_issue_notes,
+    bulk_create_mr_notes,
     cancel_job,
     cancel_pipeline,
     compare_branches,
@@ -31,6 +46,7 @@ from .tools import (
     delete_label,
     delete_pipeline,
     delete_project,
+    get_cache_stats,
     get_current_user,
     get_file,
     get_group,
@@ -41,6 +57,7 @@ from .tools import (
     get_pipeline,
     get_project,
     get_project_branch,
+    get_project_overview,
     get_release,
     get_user,
     get_wiki_page,
@@ -76,6 +93,16 @@ from .tools import (
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def _lifespan(_server: FastMCP[None]) -> AsyncIterator[None]:
+    """Share one pooled GitLab client across tool calls; close it on shutdown."""
+    try:
+        yield
+    finally:
+        await close_client()
+
+
 mcp = FastMCP(
     name="mcp-gitlab-crunchtools",
     version="0.4.1",
@@ -83,6 +110,7 @@ mcp = FastMCP(
         "Secure MCP server for GitLab projects, merge requests, issues, "
         "pipelines, and search. Works with any GitLab instance."
     ),
+    lifespan=_lifespan,
 )
 
 
@@ -92,11 +120,14 @@ async def list_projects_tool(
     search: str | None = None,
     owned: bool = False,
     membership: bool = False,
-    visibility: str | None = None,
+    visibility: Visibility | None = None,
     order_by: str = "created_at",
-    sort: str = "desc",
+    sort: SortOrder = "desc",
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
+    fields: str | None = None,
 ) -> dict[str, Any]:
     """List GitLab projects accessible by the API token.
 
@@ -109,6 +140,8 @@ async def list_projects_tool(
         sort: Sort direction (asc, desc)
         page: Page number for pagination (default: 1)
         per_page: Results per page, max 100 (default: 20)
+        all_pages: Fetch every page, up to 5000 items (default: false)
+        fields: Comma-separated item keys to return (e.g. "id,path_with_namespace"; default: all)
 
     Returns:
         List of projects with pagination info
@@ -122,6 +155,8 @@ async def list_projects_tool(
         sort=sort,
         page=page,
         per_page=per_page,
+        all_pages=all_pages,
+        fields=fields,
     )
 
 
@@ -140,12 +175,35 @@ async def get_project_tool(
     return await get_project(project_id=project_id)
 
 
+@mcp.tool()
+async def get_project_overview_tool(
+    project_id: str,
+    include: list[OverviewSection] | None = None,
+) -> dict[str, Any]:
+    """Get a GitLab project plus its labels, milestones, releases, and branches.
+
+    Fetches the project and the first page of each requested collection
+    concurrently in a single tool call.
+
+    Args:
+        project_id: Project ID (numeric) or path (e.g., "group/project")
+        include: Sections to fetch (labels, milestones, releases, branches;
+                 default: all)
+
+    Returns:
+        Project details and one list (with pagination info) per section
+    """
+    return await get_project_overview(project_id=project_id, include=include)
+
+
 @mcp.tool()
 async def list_project_branches_tool(
     project_id: str,
     search: str | None = None,
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
 ) -> dict[str, Any]:
     """List repository branches for a GitLab project.
 
@@ -154,12 +212,17 @@ async def list_project_branches_tool(
         search: Filter branches by name
         page: Page number (default: 1)
         per_page: Results per page, max 100 (default: 20)
+        all_pages: Fetch every page, up to 5000 items (default: false)
 
     Returns:
         List of branches with pagination info
     """
     return await list_project_branches(
-        project_id=project_id, search=search, page=page, per_page=per_page
+        project_id=project_id,
+        search=search,
+        page=page,
+        per_page=per_page,
+        all_pages=all_pages,
     )
 
 
@@ -189,6 +252,8 @@ async def list_project_commits_tool(
     path: str | None = None,
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
 ) -> dict[str, Any]:
     """List repository commits for a GitLab project.
 
@@ -200,6 +265,7 @@ async def list_project_commits_tool(
         path: Only commits touching this file path
         page: Page number (default: 1)
         per_page: Results per page, max 100 (default: 20)
+        all_pages: Fetch every page, up to 5000 items (default: false)
 
     Returns:
         List of commits with pagination info
@@ -212,6 +278,7 @@ async def list_project_commits_tool(
         path=path,
         page=page,
         per_page=per_page,
+        all_pages=all_pages,
     )
 
 
@@ -219,7 +286,7 @@ async def list_project_commits_tool(
 async def create_project_tool(
     name: str,
     description: str | None = None,
-    visibility: str = "private",
+    visibility: Visibility = "private",
     initialize_with_readme: bool = False,
     namespace_id: int | None = None,
 ) -> dict[str, Any]:
@@ -267,9 +334,11 @@ async def list_groups_tool(
     owned: bool = False,
     top_level_only: bool = False,
     order_by: str = "name",
-    sort: str = "asc",
+    sort: SortOrder = "asc",
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
 ) -> dict[str, Any]:
     """List GitLab groups accessible by the API token.
 
@@ -281,6 +350,7 @@ async def list_groups_tool(
         sort: Sort direction (asc, desc)
         page: Page number (default: 1)
         per_page: Results per page, max 100 (default: 20)
+        all_pages: Fetch every page, up to 5000 items (default: false)
 
     Returns:
         List of groups with pagination info
@@ -293,6 +363,7 @@ async def list_groups_tool(
         sort=sort,
         page=page,
         per_page=per_page,
+        all_pages=all_pages,
     )
 
 
@@ -317,12 +388,14 @@ async def get_group_tool(
 async def list_group_projects_tool(
     group_id: str,
     search: str | None = None,
-    visibility: str | None = None,
+    visibility: Visibility | None = None,
     include_subgroups: bool = False,
     order_by: str = "created_at",
-    sort: str = "desc",
+    sort: SortOrder = "desc",
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
 ) -> dict[str, Any]:
     """List projects within a GitLab group.
 
@@ -335,6 +408,7 @@ async def list_group_projects_tool(
         sort: Sort direction (asc, desc)
         page: Page number (default: 1)
         per_page: Results per page, max 100 (default: 20)
+        all_pages: Fetch every page, up to 5000 items (default: false)
 
     Returns:
         List of projects with pagination info
@@ -348,6 +422,7 @@ async def list_group_projects_tool(
         sort=sort,
         page=page,
         per_page=per_page,
+        all_pages=all_pages,
     )
 
 
@@ -356,14 +431,17 @@ async def list_group_projects_tool(
 @mcp.tool()
 async def list_merge_requests_tool(
     project_id: str,
-    state: str = "opened",
+    state: MergeRequestState = "opened",
     order_by: str = "created_at",
-    sort: str = "desc",
+    sort: SortOrder = "desc",
     labels: str | None = None,
     milestone: str | None = None,
     search: str | None = None,
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
+    fields: str | None = None,
 ) -> dict[str, Any]:
     """List merge requests for a GitLab project.
 
@@ -377,6 +455,8 @@ async def list_merge_requests_tool(
         search: Search in title and description
         page: Page number (default: 1)
         per_page: Results per page, max 100 (default: 20)
+        all_pages: Fetch every page, up to 5000 items (default: false)
+        fields: Comma-separated item keys to return (e.g. "iid,title,source_branch"; default: all)
 
     Returns:
         List of merge requests with pagination info
@@ -391,6 +471,8 @@ async def list_merge_requests_tool(
         search=search,
         page=page,
         per_page=per_page,
+        all_pages=all_pages,
+        fields=fields,
     )
 
 
@@ -464,7 +546,7 @@ async def update_merge_request_tool(
     title: str | None = None,
     description: str | None = None,
     labels: str | None = None,
-    state_event: str | None = None,
+    state_event: StateEvent | None = None,
     assignee_ids: list[int] | None = None,
     reviewer_ids: list[int] | None = None,
     milestone_id: int | None = None,
@@ -509,9 +591,11 @@ async def list_mr_notes_tool(
     project_id: str,
     merge_request_iid: int,
     order_by: str = "created_at",
-    sort: str = "desc",
+    sort: SortOrder = "desc",
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
 ) -> dict[str, Any]:
     """List notes (comments) on a merge request.
 
@@ -522,6 +606,7 @@ async def list_mr_notes_tool(
         sort: Sort direction (asc, desc)
         page: Page number (default: 1)
         per_page: Results per page, max 100 (default: 20)
+        all_pages: Fetch every page, up to 5000 items (default: false)
 
     Returns:
         List of notes with pagination info
@@ -533,6 +618,7 @@ async def list_mr_notes_tool(
         sort=sort,
         page=page,
         per_page=per_page,
+        all_pages=all_pages,
     )
 
 
@@ -557,6 +643,30 @@ async def create_mr_note_tool(
     )
 
 
+@mcp.tool()
+async def bulk_create_mr_notes_tool(
+    project_id: str,
+    merge_request_iid: int,
+    bodies: list[str],
+) -> dict[str, Any]:
+    """Create several notes (comments) on a merge request in one call.
+
+    Notes are posted concurrently, so their order in GitLab is not
+    guaranteed. A failed note does not stop the others.
+
+    Args:
+        project_id: Project ID or path
+        merge_request_iid: Merge request internal ID
+        bodies: Note contents (Markdown), 1 to 20 notes
+
+    Returns:
+        Created notes, or per-note errors, in input order with a failed count
+    """
+    return await bulk_create_mr_notes(
+        project_id=project_id, merge_request_iid=merge_request_iid, bodies=bodies
+    )
+
+
 @mcp.tool()
 async def get_mr_changes_tool(
     project_id: str,
@@ -630,15 +740,18 @@ async def create_mr_discussion_tool(
 @mcp.tool()
 async def list_issues_tool(
     project_id: str,
-    state: str = "opened",
+    state: IssueState = "opened",
     order_by: str = "created_at",
-    sort: str = "desc",
+    sort: SortOrder = "desc",
     labels: str | None = None,
     milestone: str | None = None,
     search: str | None = None,
     assignee_id: int | None = None,
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
+    fields: str | None = None,
 ) -> dict[str, Any]:
     """List issues for a GitLab project.
 
@@ -653,6 +766,8 @@ async def list_issues_tool(
         assignee_id: Filter by assignee user ID
         page: Page number (default: 1)
         per_page: Results per page, max 100 (default: 20)
+        all_pages: Fetch every page, up to 5000 items (default: false)
+        fields: Comma-separated item keys to return (e.g. "iid,title,state"; default: all)
 
     Returns:
         List of issues with pagination info
@@ -668,6 +783,8 @@ async def list_issues_tool(
         assignee_id=assignee_id,
         page=page,
         per_page=per_page,
+        all_pages=all_pages,
+        fields=fields,
     )
 
 
@@ -730,7 +847,7 @@ async def update_issue_tool(
     title: str | None = None,
     description: str | None = None,
     labels: str | None = None,
-    state_event: str | None = None,
+    state_event: StateEvent | None = None,
     assignee_ids: list[int] | None = None,
     milestone_id: int | None = None,
     confidential: bool | None = None,
@@ -769,9 +886,11 @@ async def list_issue_notes_tool(
     project_id: str,
     issue_iid: int,
     order_by: str = "created_at",
-    sort: str = "desc",
+    sort: SortOrder = "desc",
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
 ) -> dict[str, Any]:
     """List notes (comments) on an issue.
 
@@ -782,6 +901,7 @@ async def list_issue_notes_tool(
         sort: Sort direction (asc, desc)
         page: Page number (default: 1)
         per_page: Results per page, max 100 (default: 20)
+        all_pages: Fetch every page, up to 5000 items (default: false)
 
     Returns:
         List of notes with pagination info
@@ -793,6 +913,7 @@ async def list_issue_notes_tool(
         sort=sort,
         page=page,
         per_page=per_page,
+        all_pages=all_pages,
     )
 
 
@@ -817,6 +938,30 @@ async def create_issue_note_tool(
     )
 
 
+@mcp.tool()
+async def bulk_create_issue_notes_tool(
+    project_id: str,
+    issue_iid: int,
+    bodies: list[str],
+) -> dict[str, Any]:
+    """Create several notes (comments) on an issue in one call.
+
+    Notes are posted concurrently, so their order in GitLab is not
+    guaranteed. A failed note does not stop the others.
+
+    Args:
+        project_id: Project ID or path
+        issue_iid: Issue internal ID
+        bodies: Note contents (Markdown), 1 to 20 notes
+
+    Returns:
+        Created notes, or per-note errors, in input order with a failed count
+    """
+    return await bulk_create_issue_notes(
+        project_id=project_id, issue_iid=issue_iid, bodies=bodies
+    )
+
+
 
 
 @mcp.tool()
@@ -825,9 +970,12 @@ async def list_pipelines_tool(
     status: str | None = None,
     ref: str | None = None,
     order_by: str = "id",
-    sort: str = "desc",
+    sort: SortOrder = "desc",
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
+    fields: str | None = None,
 ) -> dict[str, Any]:
     """List CI/CD pipelines for a GitLab project.
 
@@ -840,6 +988,8 @@ async def list_pipelines_tool(
         sort: Sort direction (asc, desc)
         page: Page number (default: 1)
         per_page: Results per page, max 100 (default: 20)
+        all_pages: Fetch every page, up to 5000 items (default: false)
+        fields: Comma-separated item keys to return (e.g. "id,status,ref"; default: all)
 
     Returns:
         List of pipelines with pagination info
@@ -852,6 +1002,8 @@ async def list_pipelines_tool(
         sort=sort,
         page=page,
         per_page=per_page,
+        all_pages=all_pages,
+        fields=fields,
     )
 
 
@@ -879,6 +1031,8 @@ async def list_pipeline_jobs_tool(
     scope: str | None = None,
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
 ) -> dict[str, Any]:
     """List jobs for a CI/CD pipeline.
 
@@ -889,6 +1043,7 @@ async def list_pipeline_jobs_tool(
                success, canceled, skipped, manual)
         page: Page number (default: 1)
         per_page: Results per page, max 100 (default: 20)
+        all_pages: Fetch every page, up to 5000 items (default: false)
 
     Returns:
         List of jobs with pagination info
@@ -899,6 +1054,7 @@ async def list_pipeline_jobs_tool(
         scope=scope,
         page=page,
         per_page=per_page,
+        all_pages=all_pages,
     )
 
 
@@ -906,17 +1062,21 @@ async def list_pipeline_jobs_tool(
 async def get_job_log_tool(
     project_id: str,
     job_id: int,
+    *,
+    max_bytes: int = 262144,
 ) -> dict[str, Any]:
     """Get the log (trace) output of a CI/CD job.
 
     Args:
         project_id: Project ID or path
         job_id: Job ID
+        max_bytes: Maximum trailing bytes of the log to return (default: 262144)
 
     Returns:
-        Dictionary with job log content as plain text
+        Dictionary with the end of the job log as plain text, the full
+        log size in total_bytes, and truncated if earlier output was dropped
     """
-    return await get_job_log(project_id=project_id, job_id=job_id)
+    return await get_job_log(project_id=project_id, job_id=job_id, max_bytes=max_bytes)
 
 
 @mcp.tool()
@@ -1098,23 +1258,35 @@ async def list_repository_tree_tool(
     recursive: bool = False,
     page: int = 1,
     per_page: int = 20,
+    *,
+    keyset: bool = False,
+    page_token: str | None = None,
+    all_pages: bool = False,
 ) -> dict[str, Any]:
     """List repository tree (files and directories).
 
+    For large recursive trees, keyset pagination stays fast on deep pages:
+    pass keyset=true, then pass each pagination.next_page_token back as
+    page_token.
+
     Args:
         project_id: Project ID or path
         path: Path inside the repository (default: root)
         ref: Branch, tag, or commit SHA (default: default branch)
         recursive: List files recursively
-        page: Page number (default: 1)
+        page: Page number (default: 1, ignored with keyset pagination)
         per_page: Results per page, max 100 (default: 20)
+        keyset: Use keyset pagination instead of page numbers (default: false)
+        page_token: Keyset token of the page to fetch; implies keyset
+        all_pages: Fetch every page, up to 5000 items; overrides keyset (default: false)
 
     Returns:
         List of tree entries (blobs and trees) with pagination info
     """
     return await list_repository_tree(
         project_id=project_id, path=path, ref=ref, recursive=recursive,
-        page=page, per_page=per_page,
+        page=page, per_page=per_page, keyset=keyset, page_token=page_token,
+        all_pages=all_pages,
     )
 
 
@@ -1123,20 +1295,26 @@ async def get_file_tool(
     project_id: str,
     file_path: str,
     ref: str = "HEAD",
+    *,
+    raw: bool = False,
 ) -> dict[str, Any]:
     """Get a file from a GitLab repository.
 
-    Returns file metadata and content (base64 encoded).
+    Returns file metadata and content (base64 encoded). Set raw=true to
+    read a text file's content directly, which is smaller and needs no
+    decoding.
 
     Args:
         project_id: Project ID or path
         file_path: Path to the file in the repository
         ref: Branch, tag, or commit SHA (default: HEAD)
+        raw: Return plain text content without metadata (default: false)
 
     Returns:
-        File metadata including base64 content, size, and encoding
+        File metadata including base64 content, size, and encoding,
+        or the file's text content in raw mode
     """
-    return await get_file(project_id=project_id, file_path=file_path, ref=ref)
+    return await get_file(project_id=project_id, file_path=file_path, ref=ref, raw=raw)
 
 
 @mcp.tool()
@@ -1146,7 +1324,7 @@ async def create_file_tool(
     branch: str,
     content: str,
     commit_message: str,
-    encoding: str = "text",
+    encoding: FileEncoding = "text",
 ) -> dict[str, Any]:
     """Create a new file in a GitLab repository.
 
@@ -1174,7 +1352,7 @@ async def update_file_tool(
     branch: str,
     content: str,
     commit_message: str,
-    encoding: str = "text",
+    encoding: FileEncoding = "text",
 ) -> dict[str, Any]:
     """Update an existing file in a GitLab repository.
 
@@ -1264,6 +1442,8 @@ async def list_labels_tool(
     search: str | None = None,
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
 ) -> dict[str, Any]:
     """List labels for a GitLab project.
 
@@ -1272,12 +1452,14 @@ async def list_labels_tool(
         search: Filter labels by keyword
         page: Page number (default: 1)
         per_page: Results per page, max 100 (default: 20)
+        all_pages: Fetch every page, up to 5000 items (default: false)
 
     Returns:
         List of labels with pagination info
     """
     return await list_labels(
         project_id=project_id, search=search, page=page, per_page=per_page,
+        all_pages=all_pages,
     )
 
 
@@ -1371,6 +1553,8 @@ async def list_users_tool(
     active: bool = True,
     page: int = 1,
     per_page: int = 20,
+    *,
+    fields: str | None = None,
 ) -> dict[str, Any]:
     """List GitLab users.
 
@@ -1380,13 +1564,14 @@ async def list_users_tool(
         active: Only return active users (default: true)
         page: Page number (default: 1)
         per_page: Results per page, max 100 (default: 20)
+        fields: Comma-separated item keys to return (e.g. "id,username,name"; default: all)
 
     Returns:
         List of users with pagination info
     """
     return await list_users(
         search=search, username=username, active=active,
-        page=page, per_page=per_page,
+        page=page, per_page=per_page, fields=fields,
     )
 
 
@@ -1411,7 +1596,7 @@ async def get_user_tool(
 async def list_releases_tool(
     project_id: str,
     order_by: str = "released_at",
-    sort: str = "desc",
+    sort: SortOrder = "desc",
     page: int = 1,
     per_page: int = 20,
 ) -> dict[str, Any]:
@@ -1483,7 +1668,7 @@ async def create_release_tool(
 @mcp.tool()
 async def list_milestones_tool(
     project_id: str,
-    state: str = "active",
+    state: MilestoneState = "active",
     search: str | None = None,
     page: int = 1,
     per_page: int = 20,
@@ -1657,7 +1842,7 @@ async def create_snippet_tool(
     file_name: str,
     content: str,
     description: str | None = None,
-    visibility: str = "private",
+    visibility: Visibility = "private",
 ) -> dict[str, Any]:
     """Create a new snippet in a GitLab project.
 
@@ -1676,3 +1861,17 @@ async def create_snippet_tool(
         project_id=project_id, title=title, file_name=file_name,
         content=content, description=description, visibility=visibility,
     )
+
+
+@mcp.tool()
+async def get_cache_stats_tool() -> dict[str, Any]:
+    """Get response cache statistics for this MCP server process.
+
+    Makes no GitLab API call. Useful for tuning cache behavior and
+    GITLAB_MAX_CONCURRENCY.
+
+    Returns:
+        Cache hits, coalesced requests, misses, 304 revalidations,
+        hit rate, cached entries and bytes, and requests in flight
+    """
+    return await get_cache_stats()
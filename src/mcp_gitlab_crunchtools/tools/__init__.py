@@ -4,9 +4,11 @@ This package contains all the MCP tool implementations for GitLab operations.
 """
 
 from .branches import compare_branches, create_branch, delete_branch
+from .cache import get_cache_stats
 from .files import create_file, get_file, list_repository_tree, update_file
 from .groups import get_group, list_group_projects, list_groups
 from .issues import (
+    bulk_create_issue_notes,
     create_issue,
     create_issue_note,
     get_issue,
@@ -16,6 +18,7 @@ from .issues import (
 )
 from .labels import create_label, delete_label, list_labels, update_label
 from .merge_requests import (
+    bulk_create_mr_notes,
     create_merge_request,
     create_mr_discussion,
     create_mr_note,
@@ -45,6 +48,7 @@ from .projects import (
     delete_project,
     get_project,
     get_project_branch,
+    get_project_overview,
     list_project_branches,
     list_project_commits,
     list_projects,
@@ -58,6 +62,7 @@ from .wiki import create_wiki_page, get_wiki_page, list_wiki_pages
 __all__ = [
     "list_projects",
     "get_project",
+    "get_project_overview",
     "create_project",
     "delete_project",
     "list_project_branches",
@@ -72,6 +77,7 @@ __all__ = [
     "update_merge_request",
     "list_mr_notes",
     "create_mr_note",
+    "bulk_create_mr_notes",
     "get_mr_changes",
     "list_mr_discussions",
     "create_mr_discussion",
@@ -81,6 +87,7 @@ __all__ = [
     "update_issue",
     "list_issue_notes",
     "create_issue_note",
+    "bulk_create_issue_notes",
     "list_pipelines",
     "get_pipeline",
     "create_pipeline",
@@ -119,4 +126,5 @@ __all__ = [
     "create_snippet",
     "search_global",
     "search_project",
+    "get_cache_stats",
 ]
@@ -0,0 +1,32 @@
+"""Helpers for tools that issue several GitLab requests at once."""
+
+import asyncio
+from collections.abc import Awaitable, Iterable
+from typing import Any
+
+from ..errors import UserError
+
+
+async def gather_items(calls: Iterable[Awaitable[dict[str, Any]]]) -> dict[str, Any]:
+    """Run calls concurrently and report their results in input order.
+
+    A UserError from one call is recorded in its slot as ``{"error": ...}``
+    instead of failing the whole batch; any other exception propagates.
+    Concurrency is bounded by the client's GITLAB_MAX_CONCURRENCY limit.
+
+    Returns:
+        Dictionary with per-call items and the number of failed calls
+    """
+    results = await asyncio.gather(*calls, return_exceptions=True)
+    items: list[dict[str, Any]] = []
+    failed = 0
+    for result in results:
+        match result:
+            case UserError():
+                items.append({"error": str(result)})
+                failed += 1
+            case BaseException():
+                raise result
+            case _:
+                items.append(result)
+    return {"items": items, "failed": failed}
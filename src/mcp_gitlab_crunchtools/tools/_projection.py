@@ -0,0 +1,24 @@
+"""Helpers for trimming list responses to the fields a caller asked for."""
+
+from typing import Any
+
+
+def select_fields(result: dict[str, Any], fields: str | None) -> dict[str, Any]:
+    """Keep only the requested keys on each item of a list response.
+
+    The result may be shared with the client's response cache, so a new
+    dictionary is returned instead of editing items in place. Pagination
+    info is passed through unchanged.
+
+    Args:
+        result: List response with an "items" key
+        fields: Comma-separated item keys to keep; empty or None keeps everything
+
+    Returns:
+        List response with projected items
+    """
+    keys = tuple(dict.fromkeys(key.strip() for key in (fields or "").split(",") if key.strip()))
+    if not keys:
+        return result
+    items = [{key: item[key] for key in keys if key in item} for item in result["items"]]
+    return {**result, "items": items}
@@ -0,0 +1,19 @@
+"""Response cache diagnostics.
+
+Tools for inspecting the client's in-process GET cache without calling GitLab.
+"""
+
+from typing import Any
+
+from ..client import get_client
+
+
+async def get_cache_stats() -> dict[str, Any]:
+    """Get response cache counters for this server process.
+
+    Returns:
+        Cache hits, coalesced and missed requests, 304 revalidations,
+        hit rate, and current entry, byte and in-flight counts
+    """
+    client = get_client()
+    return client.cache_stats()
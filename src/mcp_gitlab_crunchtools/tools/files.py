@@ -7,7 +7,8 @@ from typing import Any
 from urllib.parse import quote
 
 from ..client import get_client
-from ..models import encode_project_id
+from ..errors import ValidationError
+from ..models import FileEncoding, encode_project_id
 
 
 async def list_repository_tree(
@@ -17,16 +18,27 @@ async def list_repository_tree(
     recursive: bool = False,
     page: int = 1,
     per_page: int = 20,
+    *,
+    keyset: bool = False,
+    page_token: str | None = None,
+    all_pages: bool = False,
 ) -> dict[str, Any]:
     """List repository tree (files and directories).
 
+    Keyset pagination stays fast on deep pages of large recursive trees;
+    each response's pagination.next_page_token is passed back as page_token.
+
     Args:
         project_id: Project ID or path
         path: Path inside the repository (default: root)
         ref: Branch, tag, or commit SHA (default: default branch)
         recursive: List files recursively
-        page: Page number
+        page: Page number (ignored with keyset pagination)
         per_page: Results per page
+        keyset: Use keyset pagination instead of page numbers
+        page_token: Keyset token of the page to fetch; implies keyset
+        all_pages: Fetch every page (up to 5000 items) instead of a single page;
+            overrides keyset and page_token
 
     Returns:
         List of tree entries (blobs and trees) with pagination info
@@ -34,10 +46,7 @@ async def list_repository_tree(
     client = get_client()
     encoded_id = encode_project_id(project_id)
 
-    params: dict[str, Any] = {
-        "page": page,
-        "per_page": min(per_page, 100),
-    }
+    params: dict[str, Any] = {"per_page": min(per_page, 100)}
 
     if path:
         params["path"] = path
@@ -46,35 +55,58 @@ async def list_repository_tree(
     if recursive:
         params["recursive"] = "true"
 
-    return await client.get(
-        f"/projects/{encoded_id}/repository/tree", params=params
-    )
+    endpoint = f"/projects/{encoded_id}/repository/tree"
+    if all_pages:
+        return await client.get_all_pages(endpoint, params)
+
+    if keyset or page_token:
+        params["pagination"] = "keyset"
+        if page_token:
+            params["page_token"] = page_token
+    else:
+        params["page"] = page
+    return await client.get(endpoint, params=params)
 
 
 async def get_file(
     project_id: str,
     file_path: str,
     ref: str = "HEAD",
+    *,
+    raw: bool = False,
 ) -> dict[str, Any]:
     """Get a file from the repository.
 
-    Returns file metadata and content (base64 encoded).
+    Returns file metadata and content (base64 encoded). With raw, the
+    file's text is fetched directly instead, skipping the base64 overhead;
+    raw mode is meant for text files.
 
     Args:
         project_id: Project ID or path
         file_path: Path to the file in the repository
         ref: Branch, tag, or commit SHA (default: HEAD)
+        raw: Return the plain text content without metadata
 
     Returns:
-        File metadata including content (base64), size, encoding
+        File metadata including content (base64), size, encoding, or
+        in raw mode the file path, ref, and text content
     """
     client = get_client()
     encoded_id = encode_project_id(project_id)
     encoded_path = quote(file_path, safe="")
-    return await client.get(
-        f"/projects/{encoded_id}/repository/files/{encoded_path}",
-        params={"ref": ref},
-    )
+    endpoint = f"/projects/{encoded_id}/repository/files/{encoded_path}"
+    if not raw:
+        return await client.get(endpoint, params={"ref": ref})
+
+    content = await client.get_text(f"{endpoint}/raw", params={"ref": ref})
+    if content is None:
+        raise ValidationError("File is not plain text; use raw=false for base64 content")
+    return {
+        "file_path": file_path,
+        "ref": ref,
+        "encoding": "text",
+        "content": content,
+    }
 
 
 async def create_file(
@@ -83,7 +115,7 @@ async def create_file(
     branch: str,
     content: str,
     commit_message: str,
-    encoding: str = "text",
+    encoding: FileEncoding = "text",
 ) -> dict[str, Any]:
     """Create a new file in the repository.
 
@@ -118,7 +150,7 @@ async def update_file(
     branch: str,
     content: str,
     commit_message: str,
-    encoding: str = "text",
+    encoding: FileEncoding = "text",
 ) -> dict[str, Any]:
     """Update an existing file in the repository.
 
@@ -6,7 +6,7 @@ Tools for listing and retrieving GitLab group information.
 from typing import Any
 
 from ..client import get_client
-from ..models import encode_group_id
+from ..models import SortOrder, Visibility, encode_group_id
 
 
 async def list_groups(
@@ -14,9 +14,11 @@ async def list_groups(
     owned: bool = False,
     top_level_only: bool = False,
     order_by: str = "name",
-    sort: str = "asc",
+    sort: SortOrder = "asc",
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
 ) -> dict[str, Any]:
     """List groups accessible by the API token.
 
@@ -28,6 +30,7 @@ async def list_groups(
         sort: Sort direction (asc, desc)
         page: Page number
         per_page: Results per page, max 100
+        all_pages: Fetch every page (up to 5000 items) instead of a single page
 
     Returns:
         Dictionary containing groups list and pagination info
@@ -48,7 +51,10 @@ async def list_groups(
     if top_level_only:
         params["top_level_only"] = "true"
 
-    return await client.get("/groups", params=params)
+    endpoint = "/groups"
+    if all_pages:
+        return await client.get_all_pages(endpoint, params)
+    return await client.get(endpoint, params=params)
 
 
 async def get_group(
@@ -77,12 +83,14 @@ async def get_group(
 async def list_group_projects(
     group_id: str,
     search: str | None = None,
-    visibility: str | None = None,
+    visibility: Visibility | None = None,
     include_subgroups: bool = False,
     order_by: str = "created_at",
-    sort: str = "desc",
+    sort: SortOrder = "desc",
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
 ) -> dict[str, Any]:
     """List projects within a group.
 
@@ -95,6 +103,7 @@ async def list_group_projects(
         sort: Sort direction (asc, desc)
         page: Page number
         per_page: Results per page
+        all_pages: Fetch every page (up to 5000 items) instead of a single page
 
     Returns:
         List of projects with pagination info
@@ -116,4 +125,7 @@ async def list_group_projects(
     if include_subgroups:
         params["include_subgroups"] = "true"
 
-    return await client.get(f"/groups/{encoded_id}/projects", params=params)
+    endpoint = f"/groups/{encoded_id}/projects"
+    if all_pages:
+        return await client.get_all_pages(endpoint, params)
+    return await client.get(endpoint, params=params)
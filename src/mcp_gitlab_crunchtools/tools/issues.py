@@ -6,20 +6,33 @@ Tools for listing, creating, and updating GitLab issues.
 from typing import Any
 
 from ..client import get_client
-from ..models import CreateIssueInput, UpdateIssueInput, encode_project_id
+from ..models import (
+    MAX_BULK_NOTES,
+    CreateIssueInput,
+    IssueState,
+    SortOrder,
+    StateEvent,
+    UpdateIssueInput,
+    encode_project_id,
+)
+from ._batch import gather_items
+from ._projection import select_fields
 
 
 async def list_issues(
     project_id: str,
-    state: str = "opened",
+    state: IssueState = "opened",
     order_by: str = "created_at",
-    sort: str = "desc",
+    sort: SortOrder = "desc",
     labels: str | None = None,
     milestone: str | None = None,
     search: str | None = None,
     assignee_id: int | None = None,
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
+    fields: str | None = None,
 ) -> dict[str, Any]:
     """List issues for a project.
 
@@ -34,6 +47,8 @@ async def list_issues(
         assignee_id: Filter by assignee user ID
         page: Page number
         per_page: Results per page
+        all_pages: Fetch every page (up to 5000 items) instead of a single page
+        fields: Comma-separated item keys to keep (e.g. "iid,title,state"); default keeps all
 
     Returns:
         List of issues with pagination info
@@ -58,7 +73,12 @@ async def list_issues(
     if assignee_id is not None:
         params["assignee_id"] = assignee_id
 
-    return await client.get(f"/projects/{encoded_id}/issues", params=params)
+    endpoint = f"/projects/{encoded_id}/issues"
+    if all_pages:
+        result = await client.get_all_pages(endpoint, params)
+    else:
+        result = await client.get(endpoint, params=params)
+    return select_fields(result, fields)
 
 
 async def get_issue(
@@ -114,18 +134,7 @@ async def create_issue(
     client = get_client()
     encoded_id = encode_project_id(project_id)
 
-    data: dict[str, Any] = {"title": validated.title}
-
-    if validated.description is not None:
-        data["description"] = validated.description
-    if validated.labels is not None:
-        data["labels"] = validated.labels
-    if validated.assignee_ids is not None:
-        data["assignee_ids"] = validated.assignee_ids
-    if validated.milestone_id is not None:
-        data["milestone_id"] = validated.milestone_id
-    if validated.confidential:
-        data["confidential"] = True
+    data = validated.model_dump(exclude_defaults=True)
 
     return await client.post(f"/projects/{encoded_id}/issues", json_data=data)
 
@@ -136,7 +145,7 @@ async def update_issue(
     title: str | None = None,
     description: str | None = None,
     labels: str | None = None,
-    state_event: str | None = None,
+    state_event: StateEvent | None = None,
     assignee_ids: list[int] | None = None,
     milestone_id: int | None = None,
     confidential: bool | None = None,
@@ -170,21 +179,7 @@ async def update_issue(
     client = get_client()
     encoded_id = encode_project_id(project_id)
 
-    data: dict[str, Any] = {}
-    if validated.title is not None:
-        data["title"] = validated.title
-    if validated.description is not None:
-        data["description"] = validated.description
-    if validated.labels is not None:
-        data["labels"] = validated.labels
-    if validated.state_event is not None:
-        data["state_event"] = validated.state_event
-    if validated.assignee_ids is not None:
-        data["assignee_ids"] = validated.assignee_ids
-    if validated.milestone_id is not None:
-        data["milestone_id"] = validated.milestone_id
-    if validated.confidential is not None:
-        data["confidential"] = validated.confidential
+    data = validated.model_dump(exclude_none=True)
 
     return await client.put(
         f"/projects/{encoded_id}/issues/{issue_iid}", json_data=data
@@ -195,9 +190,11 @@ async def list_issue_notes(
     project_id: str,
     issue_iid: int,
     order_by: str = "created_at",
-    sort: str = "desc",
+    sort: SortOrder = "desc",
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
 ) -> dict[str, Any]:
     """List notes (comments) on an issue.
 
@@ -208,6 +205,7 @@ async def list_issue_notes(
         sort: Sort direction (asc, desc)
         page: Page number
         per_page: Results per page
+        all_pages: Fetch every page (up to 5000 items) instead of a single page
 
     Returns:
         List of notes with pagination info
@@ -222,9 +220,10 @@ async def list_issue_notes(
         "per_page": min(per_page, 100),
     }
 
-    return await client.get(
-        f"/projects/{encoded_id}/issues/{issue_iid}/notes", params=params
-    )
+    endpoint = f"/projects/{encoded_id}/issues/{issue_iid}/notes"
+    if all_pages:
+        return await client.get_all_pages(endpoint, params)
+    return await client.get(endpoint, params=params)
 
 
 async def create_issue_note(
@@ -252,3 +251,31 @@ async def create_issue_note(
         f"/projects/{encoded_id}/issues/{issue_iid}/notes",
         json_data={"body": body},
     )
+
+
+async def bulk_create_issue_notes(
+    project_id: str,
+    issue_iid: int,
+    bodies: list[str],
+) -> dict[str, Any]:
+    """Create several notes (comments) on an issue concurrently.
+
+    Notes are posted in parallel, so their order in GitLab is not
+    guaranteed. A failed note does not stop the others.
+
+    Args:
+        project_id: Project ID or path
+        issue_iid: Issue internal ID
+        bodies: Note contents (Markdown), at most MAX_BULK_NOTES
+
+    Returns:
+        Created notes (or per-note errors) in input order, with a failed count
+    """
+    if not bodies or len(bodies) > MAX_BULK_NOTES:
+        raise ValueError(f"bodies must contain between 1 and {MAX_BULK_NOTES} notes")
+    if any(not body or not body.strip() for body in bodies):
+        raise ValueError("Note body must not be empty")
+
+    return await gather_items(
+        create_issue_note(project_id, issue_iid, body) for body in bodies
+    )
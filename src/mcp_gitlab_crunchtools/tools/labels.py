@@ -14,6 +14,8 @@ async def list_labels(
     search: str | None = None,
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
 ) -> dict[str, Any]:
     """List labels for a project.
 
@@ -22,6 +24,7 @@ async def list_labels(
         search: Filter labels by keyword
         page: Page number
         per_page: Results per page
+        all_pages: Fetch every page (up to 5000 items) instead of a single page
 
     Returns:
         List of labels with pagination info
@@ -37,7 +40,10 @@ async def list_labels(
     if search:
         params["search"] = search
 
-    return await client.get(f"/projects/{encoded_id}/labels", params=params)
+    endpoint = f"/projects/{encoded_id}/labels"
+    if all_pages:
+        return await client.get_all_pages(endpoint, params)
+    return await client.get(endpoint, params=params)
 
 
 async def create_label(
@@ -6,19 +6,32 @@ Tools for listing, creating, and updating GitLab merge requests.
 from typing import Any
 
 from ..client import get_client
-from ..models import CreateMergeRequestInput, UpdateMergeRequestInput, encode_project_id
+from ..models import (
+    MAX_BULK_NOTES,
+    CreateMergeRequestInput,
+    MergeRequestState,
+    SortOrder,
+    StateEvent,
+    UpdateMergeRequestInput,
+    encode_project_id,
+)
+from ._batch import gather_items
+from ._projection import select_fields
 
 
 async def list_merge_requests(
     project_id: str,
-    state: str = "opened",
+    state: MergeRequestState = "opened",
     order_by: str = "created_at",
-    sort: str = "desc",
+    sort: SortOrder = "desc",
     labels: str | None = None,
     milestone: str | None = None,
     search: str | None = None,
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
+    fields: str | None = None,
 ) -> dict[str, Any]:
     """List merge requests for a project.
 
@@ -32,6 +45,9 @@ async def list_merge_requests(
         search: Search in title and description
         page: Page number
         per_page: Results per page
+        all_pages: Fetch every page (up to 5000 items) instead of a single page
+        fields: Comma-separated item keys to keep (e.g. "iid,title,source_branch");
+                default keeps all
 
     Returns:
         List of merge requests with pagination info
@@ -54,7 +70,12 @@ async def list_merge_requests(
     if search:
         params["search"] = search
 
-    return await client.get(f"/projects/{encoded_id}/merge_requests", params=params)
+    endpoint = f"/projects/{encoded_id}/merge_requests"
+    if all_pages:
+        result = await client.get_all_pages(endpoint, params)
+    else:
+        result = await client.get(endpoint, params=params)
+    return select_fields(result, fields)
 
 
 async def get_merge_request(
@@ -119,24 +140,7 @@ async def create_merge_request(
     client = get_client()
     encoded_id = encode_project_id(project_id)
 
-    data: dict[str, Any] = {
-        "source_branch": validated.source_branch,
-        "target_branch": validated.target_branch,
-        "title": validated.title,
-    }
-
-    if validated.description is not None:
-        data["description"] = validated.description
-    if validated.labels is not None:
-        data["labels"] = validated.labels
-    if validated.assignee_ids is not None:
-        data["assignee_ids"] = validated.assignee_ids
-    if validated.reviewer_ids is not None:
-        data["reviewer_ids"] = validated.reviewer_ids
-    if validated.milestone_id is not None:
-        data["milestone_id"] = validated.milestone_id
-    if validated.remove_source_branch:
-        data["remove_source_branch"] = True
+    data = validated.model_dump(exclude_defaults=True)
 
     return await client.post(f"/projects/{encoded_id}/merge_requests", json_data=data)
 
@@ -147,7 +151,7 @@ async def update_merge_request(
     title: str | None = None,
     description: str | None = None,
     labels: str | None = None,
-    state_event: str | None = None,
+    state_event: StateEvent | None = None,
     assignee_ids: list[int] | None = None,
     reviewer_ids: list[int] | None = None,
     milestone_id: int | None = None,
@@ -187,25 +191,7 @@ async def update_merge_request(
     client = get_client()
     encoded_id = encode_project_id(project_id)
 
-    data: dict[str, Any] = {}
-    if validated.title is not None:
-        data["title"] = validated.title
-    if validated.description is not None:
-        data["description"] = validated.description
-    if validated.labels is not None:
-        data["labels"] = validated.labels
-    if validated.state_event is not None:
-        data["state_event"] = validated.state_event
-    if validated.assignee_ids is not None:
-        data["assignee_ids"] = validated.assignee_ids
-    if validated.reviewer_ids is not None:
-        data["reviewer_ids"] = validated.reviewer_ids
-    if validated.milestone_id is not None:
-        data["milestone_id"] = validated.milestone_id
-    if validated.target_branch is not None:
-        data["target_branch"] = validated.target_branch
-    if validated.remove_source_branch is not None:
-        data["remove_source_branch"] = validated.remove_source_branch
+    data = validated.model_dump(exclude_none=True)
 
     return await client.put(
         f"/projects/{encoded_id}/merge_requests/{merge_request_iid}", json_data=data
@@ -216,9 +202,11 @@ async def list_mr_notes(
     project_id: str,
     merge_request_iid: int,
     order_by: str = "created_at",
-    sort: str = "desc",
+    sort: SortOrder = "desc",
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
 ) -> dict[str, Any]:
     """List notes (comments) on a merge request.
 
@@ -229,6 +217,7 @@ async def list_mr_notes(
         sort: Sort direction (asc, desc)
         page: Page number
         per_page: Results per page
+        all_pages: Fetch every page (up to 5000 items) instead of a single page
 
     Returns:
         List of notes with pagination info
@@ -243,9 +232,10 @@ async def list_mr_notes(
         "per_page": min(per_page, 100),
     }
 
-    return await client.get(
-        f"/projects/{encoded_id}/merge_requests/{merge_request_iid}/notes", params=params
-    )
+    endpoint = f"/projects/{encoded_id}/merge_requests/{merge_request_iid}/notes"
+    if all_pages:
+        return await client.get_all_pages(endpoint, params)
+    return await client.get(endpoint, params=params)
 
 
 async def create_mr_note(
@@ -275,6 +265,34 @@ async def create_mr_note(
     )
 
 
+async def bulk_create_mr_notes(
+    project_id: str,
+    merge_request_iid: int,
+    bodies: list[str],
+) -> dict[str, Any]:
+    """Create several notes (comments) on a merge request concurrently.
+
+    Notes are posted in parallel, so their order in GitLab is not
+    guaranteed. A failed note does not stop the others.
+
+    Args:
+        project_id: Project ID or path
+        merge_request_iid: Merge request internal ID
+        bodies: Note contents (Markdown), at most MAX_BULK_NOTES
+
+    Returns:
+        Created notes (or per-note errors) in input order, with a failed count
+    """
+    if not bodies or len(bodies) > MAX_BULK_NOTES:
+        raise ValueError(f"bodies must contain between 1 and {MAX_BULK_NOTES} notes")
+    if any(not body or not body.strip() for body in bodies):
+        raise ValueError("Note body must not be empty")
+
+    return await gather_items(
+        create_mr_note(project_id, merge_request_iid, body) for body in bodies
+    )
+
+
 async def get_mr_changes(
     project_id: str,
     merge_request_iid: int,
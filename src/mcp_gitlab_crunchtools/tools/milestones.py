@@ -6,12 +6,12 @@ Tools for managing GitLab project milestones for sprint/iteration tracking.
 from typing import Any
 
 from ..client import get_client
-from ..models import encode_project_id
+from ..models import MilestoneState, encode_project_id
 
 
 async def list_milestones(
     project_id: str,
-    state: str = "active",
+    state: MilestoneState = "active",
     search: str | None = None,
     page: int = 1,
     per_page: int = 20,
@@ -32,11 +32,12 @@ async def list_milestones(
     encoded_id = encode_project_id(project_id)
 
     params: dict[str, Any] = {
-        "state": state,
         "page": page,
         "per_page": min(per_page, 100),
     }
 
+    if state != "all":
+        params["state"] = state
     if search:
         params["search"] = search
 
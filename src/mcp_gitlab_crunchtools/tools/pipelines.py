@@ -5,8 +5,12 @@ Tools for listing, inspecting, and managing GitLab CI/CD pipelines and jobs.
 
 from typing import Any
 
-from ..client import get_client
-from ..models import encode_project_id
+from ..client import MAX_RESPONSE_SIZE, get_client
+from ..errors import ValidationError
+from ..models import SortOrder, encode_project_id
+from ._projection import select_fields
+
+DEFAULT_JOB_LOG_BYTES = 256 * 1024
 
 
 async def list_pipelines(
@@ -14,9 +18,12 @@ async def list_pipelines(
     status: str | None = None,
     ref: str | None = None,
     order_by: str = "id",
-    sort: str = "desc",
+    sort: SortOrder = "desc",
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
+    fields: str | None = None,
 ) -> dict[str, Any]:
     """List pipelines for a project.
 
@@ -29,6 +36,8 @@ async def list_pipelines(
         sort: Sort direction (asc, desc)
         page: Page number
         per_page: Results per page
+        all_pages: Fetch every page (up to 5000 items) instead of a single page
+        fields: Comma-separated item keys to keep (e.g. "id,status,ref"); default keeps all
 
     Returns:
         List of pipelines with pagination info
@@ -48,7 +57,12 @@ async def list_pipelines(
     if ref:
         params["ref"] = ref
 
-    return await client.get(f"/projects/{encoded_id}/pipelines", params=params)
+    endpoint = f"/projects/{encoded_id}/pipelines"
+    if all_pages:
+        result = await client.get_all_pages(endpoint, params)
+    else:
+        result = await client.get(endpoint, params=params)
+    return select_fields(result, fields)
 
 
 async def get_pipeline(
@@ -75,6 +89,8 @@ async def list_pipeline_jobs(
     scope: str | None = None,
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
 ) -> dict[str, Any]:
     """List jobs for a pipeline.
 
@@ -85,6 +101,7 @@ async def list_pipeline_jobs(
                success, canceled, skipped, manual)
         page: Page number
         per_page: Results per page
+        all_pages: Fetch every page (up to 5000 items) instead of a single page
 
     Returns:
         List of jobs with pagination info
@@ -100,27 +117,39 @@ async def list_pipeline_jobs(
     if scope:
         params["scope"] = scope
 
-    return await client.get(
-        f"/projects/{encoded_id}/pipelines/{pipeline_id}/jobs", params=params
-    )
+    endpoint = f"/projects/{encoded_id}/pipelines/{pipeline_id}/jobs"
+    if all_pages:
+        return await client.get_all_pages(endpoint, params)
+    return await client.get(endpoint, params=params)
 
 
 async def get_job_log(
     project_id: str,
     job_id: int,
+    *,
+    max_bytes: int = DEFAULT_JOB_LOG_BYTES,
 ) -> dict[str, Any]:
     """Get the log (trace) output of a job.
 
+    Only the end of the log is kept, since that is where failures are
+    reported; the full trace is streamed but never held in memory.
+
     Args:
         project_id: Project ID or path
         job_id: Job ID
+        max_bytes: Maximum number of trailing log bytes to return
 
     Returns:
-        Dictionary with job log content
+        Dictionary with job log content, total_bytes, and truncated flag
     """
+    if not 1 <= max_bytes <= MAX_RESPONSE_SIZE:
+        raise ValidationError(f"max_bytes must be between 1 and {MAX_RESPONSE_SIZE}")
+
     client = get_client()
     encoded_id = encode_project_id(project_id)
-    return await client.get(f"/projects/{encoded_id}/jobs/{job_id}/trace")
+    return await client.get_text_tail(
+        f"/projects/{encoded_id}/jobs/{job_id}/trace", max_bytes
+    )
 
 
 async def create_pipeline(
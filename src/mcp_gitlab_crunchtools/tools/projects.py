@@ -4,21 +4,44 @@ Tools for listing and retrieving GitLab project information,
 branches, and commits.
 """
 
+import asyncio
 from typing import Any
 
 from ..client import get_client
-from ..models import CreateProjectInput, encode_project_id
+from ..errors import ValidationError
+from ..models import (
+    OVERVIEW_SECTIONS,
+    CreateProjectInput,
+    OverviewSection,
+    SortOrder,
+    Visibility,
+    encode_project_id,
+)
+from ._projection import select_fields
+
+OVERVIEW_ENDPOINTS = {
+    "labels": "labels",
+    "milestones": "milestones",
+    "releases": "releases",
+    "branches": "repository/branches",
+}
+OVERVIEW_PER_PAGE = 20
+
+_OVERVIEW_ERROR = f"Invalid overview section. Allowed: {', '.join(OVERVIEW_SECTIONS)}"
 
 
 async def list_projects(
     search: str | None = None,
     owned: bool = False,
     membership: bool = False,
-    visibility: str | None = None,
+    visibility: Visibility | None = None,
     order_by: str = "created_at",
-    sort: str = "desc",
+    sort: SortOrder = "desc",
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
+    fields: str | None = None,
 ) -> dict[str, Any]:
     """List projects accessible by the API token.
 
@@ -31,6 +54,8 @@ async def list_projects(
         sort: Sort direction (asc, desc)
         page: Page number for pagination
         per_page: Results per page, max 100
+        all_pages: Fetch every page (up to 5000 items) instead of a single page
+        fields: Comma-separated item keys to keep (e.g. "id,path_with_namespace"); default keeps all
 
     Returns:
         Dictionary containing projects list and pagination info
@@ -53,7 +78,12 @@ async def list_projects(
     if visibility:
         params["visibility"] = visibility
 
-    return await client.get("/projects", params=params)
+    endpoint = "/projects"
+    if all_pages:
+        result = await client.get_all_pages(endpoint, params)
+    else:
+        result = await client.get(endpoint, params=params)
+    return select_fields(result, fields)
 
 
 async def get_project(
@@ -72,11 +102,46 @@ async def get_project(
     return await client.get(f"/projects/{encoded_id}")
 
 
+async def get_project_overview(
+    project_id: str,
+    include: list[OverviewSection] | None = None,
+) -> dict[str, Any]:
+    """Get project details together with the first page of related collections.
+
+    All requests are issued concurrently, so the overview costs one round
+    trip instead of one per collection.
+
+    Args:
+        project_id: Project ID or path
+        include: Sections to fetch (labels, milestones, releases, branches;
+                 default: all)
+
+    Returns:
+        Dictionary with the project and one list response per section
+    """
+    sections = tuple(dict.fromkeys(include or OVERVIEW_SECTIONS))
+    if not OVERVIEW_ENDPOINTS.keys() >= set(sections):
+        raise ValidationError(_OVERVIEW_ERROR)
+
+    client = get_client()
+    base = f"/projects/{encode_project_id(project_id)}"
+    params = {"per_page": OVERVIEW_PER_PAGE}
+
+    project, *lists = await asyncio.gather(
+        client.get(base),
+        *(client.get(f"{base}/{OVERVIEW_ENDPOINTS[section]}", params=params)
+          for section in sections),
+    )
+    return {"project": project, **dict(zip(sections, lists, strict=True))}
+
+
 async def list_project_branches(
     project_id: str,
     search: str | None = None,
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
 ) -> dict[str, Any]:
     """List repository branches for a project.
 
@@ -85,6 +150,7 @@ async def list_project_branches(
         search: Filter branches by name
         page: Page number
         per_page: Results per page
+        all_pages: Fetch every page (up to 5000 items) instead of a single page
 
     Returns:
         List of branches with pagination info
@@ -100,7 +166,10 @@ async def list_project_branches(
     if search:
         params["search"] = search
 
-    return await client.get(f"/projects/{encoded_id}/repository/branches", params=params)
+    endpoint = f"/projects/{encoded_id}/repository/branches"
+    if all_pages:
+        return await client.get_all_pages(endpoint, params)
+    return await client.get(endpoint, params=params)
 
 
 async def get_project_branch(
@@ -129,6 +198,8 @@ async def list_project_commits(
     path: str | None = None,
     page: int = 1,
     per_page: int = 20,
+    *,
+    all_pages: bool = False,
 ) -> dict[str, Any]:
     """List repository commits for a project.
 
@@ -140,6 +211,7 @@ async def list_project_commits(
         path: Only commits touching this file path
         page: Page number
         per_page: Results per page
+        all_pages: Fetch every page (up to 5000 items) instead of a single page
 
     Returns:
         List of commits with pagination info
@@ -161,13 +233,16 @@ async def list_project_commits(
     if path:
         params["path"] = path
 
-    return await client.get(f"/projects/{encoded_id}/repository/commits", params=params)
+    endpoint = f"/projects/{encoded_id}/repository/commits"
+    if all_pages:
+        return await client.get_all_pages(endpoint, params)
+    return await client.get(endpoint, params=params)
 
 
 async def create_project(
     name: str,
     description: str | None = None,
-    visibility: str = "private",
+    visibility: Visibility = "private",
     initialize_with_readme: bool = False,
     namespace_id: int | None = None,
 ) -> dict[str, Any]:
@@ -193,17 +268,7 @@ async def create_project(
 
     client = get_client()
 
-    data: dict[str, Any] = {
-        "name": validated.name,
-        "visibility": validated.visibility,
-    }
-
-    if validated.description is not None:
-        data["description"] = validated.description
-    if validated.initialize_with_readme:
-        data["initialize_with_readme"] = True
-    if validated.namespace_id is not None:
-        data["namespace_id"] = validated.namespace_id
+    data = {"visibility": validated.visibility, **validated.model_dump(exclude_defaults=True)}
 
     return await client.post("/projects", json_data=data)
 
@@ -6,13 +6,13 @@ Tools for managing GitLab project releases.
 from typing import Any
 
 from ..client import get_client
-from ..models import encode_project_id
+from ..models import SortOrder, encode_project_id
 
 
 async def list_releases(
     project_id: str,
     order_by: str = "released_at",
-    sort: str = "desc",
+    sort: SortOrder = "desc",
     page: int = 1,
     per_page: int = 20,
 ) -> dict[str, Any]:
@@ -9,6 +9,13 @@ from ..client import get_client
 from ..errors import ValidationError
 from ..models import SEARCH_SCOPES, encode_project_id
 
+PROJECT_SEARCH_SCOPES = SEARCH_SCOPES - {"projects", "snippet_titles", "users"}
+
+_SCOPE_ERROR = f"Invalid search scope. Allowed: {', '.join(sorted(SEARCH_SCOPES))}"
+_PROJECT_SCOPE_ERROR = (
+    f"Invalid project search scope. Allowed: {', '.join(sorted(PROJECT_SEARCH_SCOPES))}"
+)
+
 
 async def search_global(
     search: str,
@@ -32,8 +39,7 @@ async def search_global(
         raise ValidationError("Search query must not be empty")
 
     if scope not in SEARCH_SCOPES:
-        allowed = ", ".join(sorted(SEARCH_SCOPES))
-        raise ValidationError(f"Invalid search scope. Allowed: {allowed}")
+        raise ValidationError(_SCOPE_ERROR)
 
     client = get_client()
 
@@ -70,10 +76,8 @@ async def search_project(
     if not search or not search.strip():
         raise ValidationError("Search query must not be empty")
 
-    project_scopes = SEARCH_SCOPES - {"projects", "snippet_titles", "users"}
-    if scope not in project_scopes:
-        allowed = ", ".join(sorted(project_scopes))
-        raise ValidationError(f"Invalid project search scope. Allowed: {allowed}")
+    if scope not in PROJECT_SEARCH_SCOPES:
+        raise ValidationError(_PROJECT_SCOPE_ERROR)
 
     client = get_client()
     encoded_id = encode_project_id(project_id)
@@ -6,7 +6,7 @@ Tools for managing GitLab project snippets (shared code fragments).
 from typing import Any
 
 from ..client import get_client
-from ..models import encode_project_id
+from ..models import Visibility, encode_project_id
 
 
 async def list_snippets(
@@ -43,7 +43,7 @@ async def create_snippet(
     file_name: str,
     content: str,
     description: str | None = None,
-    visibility: str = "private",
+    visibility: Visibility = "private",
 ) -> dict[str, Any]:
     """Create a new snippet in a project.
 
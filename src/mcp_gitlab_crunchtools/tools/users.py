@@ -6,6 +6,7 @@ Tools for looking up GitLab users and the current authenticated user.
 from typing import Any
 
 from ..client import get_client
+from ._projection import select_fields
 
 
 async def get_current_user() -> dict[str, Any]:
@@ -24,6 +25,8 @@ async def list_users(
     active: bool = True,
     page: int = 1,
     per_page: int = 20,
+    *,
+    fields: str | None = None,
 ) -> dict[str, Any]:
     """List GitLab users.
 
@@ -33,6 +36,7 @@ async def list_users(
         active: Only return active users (default: true)
         page: Page number
         per_page: Results per page
+        fields: Comma-separated item keys to keep (e.g. "id,username,name"); default keeps all
 
     Returns:
         List of users with pagination info
@@ -51,7 +55,8 @@ async def list_users(
     if active:
         params["active"] = "true"
 
-    return await client.get("/users", params=params)
+    result = await client.get("/users", params=params)
+    return select_fields(result, fields)
 
 
 async def get_user(
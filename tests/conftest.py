@@ -1,7 +1,8 @@
 """Shared test fixtures for mcp-gitlab tests."""
 
 import os
-from collections.abc import Generator
+from collections.abc import AsyncIterator, Generator
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, patch
 
 import httpx
@@ -10,14 +11,14 @@ import pytest
 
 @pytest.fixture(autouse=True)
 def _reset_client_singleton() -> Generator[None, None, None]:
-    """Reset the global client and config singletons between tests."""
+    """Reset the per-loop clients and config singleton between tests."""
     import mcp_gitlab_crunchtools.client as client_mod
     import mcp_gitlab_crunchtools.config as config_mod
 
-    client_mod._client = None
+    client_mod._clients.clear()
     config_mod._config = None
     yield
-    client_mod._client = None
+    client_mod._clients.clear()
     config_mod._config = None
 
 
@@ -45,11 +46,13 @@ def _patch_client(mock_response: httpx.Response):
     """Patch the httpx AsyncClient to return a mock response.
 
     Sets GITLAB_TOKEN so config initializes, then mocks the HTTP layer.
+    Streamed requests are routed through ``request`` so tests can set
+    return values and inspect calls in one place.
     """
     import mcp_gitlab_crunchtools.client as client_mod
     import mcp_gitlab_crunchtools.config as config_mod
 
-    client_mod._client = None
+    client_mod._clients.clear()
     config_mod._config = None
 
     os.environ.setdefault("GITLAB_TOKEN", "glpat-test-mock-token")
@@ -57,6 +60,12 @@ def _patch_client(mock_response: httpx.Response):
     mock_http = AsyncMock(spec=httpx.AsyncClient)
     mock_http.request = AsyncMock(return_value=mock_response)
 
+    @asynccontextmanager
+    async def _stream(*args: object, **kwargs: object) -> AsyncIterator[httpx.Response]:
+        yield await mock_http.request(*args, **kwargs)
+
+    mock_http.stream = _stream
+
     return patch.object(
         httpx, "AsyncClient", return_value=mock_http,
     )
@@ -28,10 +28,27 @@ class TestToolRegistration:
             assert callable(func), f"{name} is not callable"
 
     def test_tool_count(self) -> None:
-        """Server should have exactly 63 tools registered."""
+        """Server should have exactly 67 tools registered."""
         from mcp_gitlab_crunchtools.tools import __all__
 
-        assert len(__all__) == 63
+        assert len(__all__) == 67
+
+    @pytest.mark.asyncio
+    async def test_enum_params_advertised_in_schema(self) -> None:
+        """Enum-like parameters should be published as JSON schema enums."""
+        from mcp_gitlab_crunchtools.server import mcp
+
+        tool = await mcp.get_tool("list_merge_requests_tool")
+        assert tool is not None
+        properties = tool.parameters["properties"]
+
+        assert properties["state"]["enum"] == ["opened", "closed", "merged", "all"]
+        assert properties["sort"]["enum"] == ["asc", "desc"]
+
+        projects = await mcp.get_tool("list_projects_tool")
+        assert projects is not None
+        visibility = projects.parameters["properties"]["visibility"]["anyOf"][0]
+        assert visibility["enum"] == ["public", "internal", "private"]
 
 
 class TestErrorSafety:
@@ -233,6 +250,55 @@ class TestConfigSafety:
             del os.environ["GITLAB_TOKEN"]
             del os.environ["SSL_CERT_FILE"]
 
+    def test_config_rate_limit_default(self) -> None:
+        """Config should default to 300 requests per minute."""
+        import os
+
+        os.environ["GITLAB_TOKEN"] = "glpat-test"
+        os.environ.pop("GITLAB_RATE_LIMIT", None)
+
+        try:
+            from mcp_gitlab_crunchtools.config import Config
+
+            config = Config()
+            assert config.rate_limit == 300
+        finally:
+            del os.environ["GITLAB_TOKEN"]
+
+    def test_config_rejects_invalid_rate_limit(self) -> None:
+        """Config should reject a non-positive GITLAB_RATE_LIMIT."""
+        import os
+
+        from mcp_gitlab_crunchtools.config import Config
+        from mcp_gitlab_crunchtools.errors import ConfigurationError
+
+        os.environ["GITLAB_TOKEN"] = "glpat-test"
+        os.environ["GITLAB_RATE_LIMIT"] = "0"
+
+        try:
+            with pytest.raises(ConfigurationError, match="GITLAB_RATE_LIMIT"):
+                Config()
+        finally:
+            del os.environ["GITLAB_TOKEN"]
+            del os.environ["GITLAB_RATE_LIMIT"]
+
+    def test_config_max_concurrency(self) -> None:
+        """Config should read GITLAB_MAX_CONCURRENCY and default to 16."""
+        import os
+
+        from mcp_gitlab_crunchtools.config import Config
+
+        os.environ["GITLAB_TOKEN"] = "glpat-test"
+        os.environ.pop("GITLAB_MAX_CONCURRENCY", None)
+
+        try:
+            assert Config().max_concurrency == 16
+            os.environ["GITLAB_MAX_CONCURRENCY"] = "4"
+            assert Config().max_concurrency == 4
+        finally:
+            del os.environ["GITLAB_TOKEN"]
+            os.environ.pop("GITLAB_MAX_CONCURRENCY", None)
+
 
 class TestPipelineTools:
     """Tests for pipeline tools with mocked API responses."""
@@ -288,6 +354,19 @@ class TestPipelineTools:
         assert result["id"] == 101
         assert result["status"] == "created"
 
+    @pytest.mark.asyncio
+    async def test_create_pipeline_sends_orjson_body(self) -> None:
+        """JSON bodies should be pre-serialized to bytes."""
+        from mcp_gitlab_crunchtools.tools import create_pipeline
+
+        resp = _mock_response(status_code=201, json_data={"id": 101})
+
+        with _patch_client(resp) as mock_cls:
+            await create_pipeline(project_id="12345", ref="develop")
+
+        call_args = mock_cls.return_value.request.call_args
+        assert call_args.kwargs["content"] == b'{"ref":"develop"}'
+
     @pytest.mark.asyncio
     async def test_retry_pipeline(self) -> None:
         """retry_pipeline should POST and return retried pipeline."""
@@ -366,6 +445,41 @@ class TestJobTools:
             result = await get_job_log(project_id="12345", job_id=500)
 
         assert "42 tests passed" in result["content"]
+        assert result["truncated"] is False
+
+    @pytest.mark.asyncio
+    async def test_get_job_log_keeps_tail(self) -> None:
+        """get_job_log should return only the last max_bytes of a long log."""
+        from mcp_gitlab_crunchtools.tools import get_job_log
+
+        log = "".join(f"line {n}\n" for n in range(10000))
+        resp = _mock_response(text=log, content_type="text/plain")
+
+        with _patch_client(resp) as mock_cls:
+            result = await get_job_log(project_id="12345", job_id=500, max_bytes=10)
+
+        kwargs = mock_cls.return_value.request.call_args.kwargs
+        assert kwargs["extensions"] == {"mcp_gitlab.unbounded_body": True}
+        assert result["content"] == "line 9999\n"
+        assert result["total_bytes"] == len(log)
+        assert result["truncated"] is True
+
+    @pytest.mark.asyncio
+    async def test_get_job_log_retries_rate_limit(self) -> None:
+        """A 429 on the job trace should be retried after Retry-After."""
+        from mcp_gitlab_crunchtools.tools import get_job_log
+
+        limited = _mock_response(
+            status_code=429, text="", content_type="text/plain", headers={"retry-after": "0"}
+        )
+        ok = _mock_response(text="done\n", content_type="text/plain")
+
+        with _patch_client(ok) as mock_cls:
+            mock_cls.return_value.request.side_effect = [limited, ok]
+            result = await get_job_log(project_id="12345", job_id=500)
+
+        assert result["content"] == "done\n"
+        assert mock_cls.return_value.request.await_count == 2
 
     @pytest.mark.asyncio
     async def test_retry_job(self) -> None:
@@ -442,6 +556,40 @@ class TestProjectTools:
 
         assert result["name"] == "project-a"
 
+    @pytest.mark.asyncio
+    async def test_get_project_overview(self) -> None:
+        """get_project_overview should fetch the project and each section."""
+        from mcp_gitlab_crunchtools.tools import get_project_overview
+
+        project = _mock_response(json_data={"id": 1, "name": "project-a"})
+        labels = _mock_response(json_data=[{"name": "bug"}])
+        branches = _mock_response(json_data=[{"name": "main"}])
+
+        with _patch_client(project) as mock_cls:
+            mock_cls.return_value.request.side_effect = [project, labels, branches]
+            result = await get_project_overview(
+                project_id="1", include=["labels", "branches"]
+            )
+
+        urls = [c.kwargs["url"] for c in mock_cls.return_value.request.await_args_list]
+        assert urls == [
+            "/projects/1",
+            "/projects/1/labels",
+            "/projects/1/repository/branches",
+        ]
+        assert result["project"]["name"] == "project-a"
+        assert result["labels"]["items"] == [{"name": "bug"}]
+        assert result["branches"]["items"] == [{"name": "main"}]
+
+    @pytest.mark.asyncio
+    async def test_get_project_overview_rejects_unknown_section(self) -> None:
+        """Unknown overview sections should fail before any request."""
+        from mcp_gitlab_crunchtools.errors import ValidationError
+        from mcp_gitlab_crunchtools.tools import get_project_overview
+
+        with pytest.raises(ValidationError, match="overview section"):
+            await get_project_overview(project_id="1", include=["wikis"])  # type: ignore[list-item]
+
     @pytest.mark.asyncio
     async def test_get_project_by_path(self) -> None:
         """get_project should URL-encode path-style project IDs."""
@@ -543,6 +691,26 @@ class TestIssueTools:
 
         assert result["state"] == "closed"
 
+    @pytest.mark.asyncio
+    async def test_issue_payloads_omit_unset_fields(self) -> None:
+        """Only explicitly set fields should be sent in issue payloads."""
+        import orjson
+
+        from mcp_gitlab_crunchtools.tools import create_issue, update_issue
+
+        resp = _mock_response(json_data={"id": 10})
+
+        with _patch_client(resp) as mock_cls:
+            await create_issue(project_id="1", title="Bug", confidential=True)
+            await update_issue(project_id="1", issue_iid=1, labels="bug")
+
+        create_call, update_call = mock_cls.return_value.request.call_args_list
+        assert orjson.loads(create_call.kwargs["content"]) == {
+            "title": "Bug",
+            "confidential": True,
+        }
+        assert orjson.loads(update_call.kwargs["content"]) == {"labels": "bug"}
+
     @pytest.mark.asyncio
     async def test_create_issue_note(self) -> None:
         """create_issue_note should POST and return note."""
@@ -558,6 +726,25 @@ class TestIssueTools:
 
         assert result["body"] == "Fixed in v2.0"
 
+    @pytest.mark.asyncio
+    async def test_bulk_create_issue_notes(self) -> None:
+        """bulk_create_issue_notes should POST each note and keep input order."""
+        from mcp_gitlab_crunchtools.tools import bulk_create_issue_notes
+
+        created = [
+            _mock_response(status_code=201, json_data={"id": n, "body": f"note {n}"})
+            for n in (1, 2)
+        ]
+
+        with _patch_client(created[0]) as mock_cls:
+            mock_cls.return_value.request.side_effect = created
+            result = await bulk_create_issue_notes(
+                project_id="1", issue_iid=1, bodies=["note 1", "note 2"]
+            )
+
+        assert [item["body"] for item in result["items"]] == ["note 1", "note 2"]
+        assert result["failed"] == 0
+
 
 class TestMergeRequestTools:
     """Tests for merge request tools with mocked API responses."""
@@ -590,6 +777,24 @@ class TestMergeRequestTools:
         assert result["iid"] == 5
         assert result["source_branch"] == "feature"
 
+    @pytest.mark.asyncio
+    async def test_bulk_create_mr_notes_reports_failures(self) -> None:
+        """bulk_create_mr_notes should record a failed note without failing the batch."""
+        from mcp_gitlab_crunchtools.tools import bulk_create_mr_notes
+
+        created = _mock_response(status_code=201, json_data={"id": 1, "body": "LGTM"})
+        forbidden = _mock_response(status_code=403, json_data={"message": "403 Forbidden"})
+
+        with _patch_client(created) as mock_cls:
+            mock_cls.return_value.request.side_effect = [created, forbidden]
+            result = await bulk_create_mr_notes(
+                project_id="1", merge_request_iid=5, bodies=["LGTM", "Nit"]
+            )
+
+        assert result["items"][0]["body"] == "LGTM"
+        assert "Permission denied" in result["items"][1]["error"]
+        assert result["failed"] == 1
+
     @pytest.mark.asyncio
     async def test_get_mr_changes(self) -> None:
         """get_mr_changes should return diff data."""
@@ -628,6 +833,15 @@ class TestSearchTools:
         assert len(result["items"]) == 1
         assert result["items"][0]["name"] == "auth-service"
 
+    @pytest.mark.asyncio
+    async def test_search_project_rejects_global_scope(self) -> None:
+        """search_project should reject scopes only valid for global search."""
+        from mcp_gitlab_crunchtools.errors import ValidationError
+        from mcp_gitlab_crunchtools.tools import search_project
+
+        with pytest.raises(ValidationError, match="Allowed: blobs, commits"):
+            await search_project(project_id="1", search="auth", scope="users")
+
 
 class TestClientErrorHandling:
     """Tests for HTTP client error responses."""
@@ -675,6 +889,33 @@ class TestClientErrorHandling:
         with _patch_client(resp), pytest.raises(RateLimitError):
             await list_projects()
 
+    def test_rate_limit_wait_uses_reset_header(self) -> None:
+        """Without Retry-After, a 429 should wait until RateLimit-Reset."""
+        import time
+
+        import httpx
+
+        from mcp_gitlab_crunchtools.client import _rate_limit_wait
+
+        reset = str(int(time.time()) + 5)
+
+        assert _rate_limit_wait(httpx.Headers({"retry-after": "3"})) == 3.0
+        wait = _rate_limit_wait(httpx.Headers({"ratelimit-reset": reset}))
+        assert wait is not None
+        assert 3.0 < wait <= 5.0
+        assert _rate_limit_wait(httpx.Headers({})) is None
+
+    @pytest.mark.asyncio
+    async def test_empty_error_body(self) -> None:
+        """An error with no body should report an unknown error."""
+        from mcp_gitlab_crunchtools.errors import GitLabApiError
+        from mcp_gitlab_crunchtools.tools import list_projects
+
+        resp = _mock_response(status_code=500, text="", content_type="text/plain")
+
+        with _patch_client(resp), pytest.raises(GitLabApiError, match="Unknown error"):
+            await list_projects()
+
     @pytest.mark.asyncio
     async def test_204_returns_deleted_status(self) -> None:
         """204 No Content should return {status: deleted}."""
@@ -687,6 +928,588 @@ class TestClientErrorHandling:
 
         assert result == {"status": "deleted"}
 
+    @pytest.mark.asyncio
+    async def test_503_retried_for_get(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Transient 5xx responses should be retried for idempotent requests."""
+        import mcp_gitlab_crunchtools.client as client_mod
+        from mcp_gitlab_crunchtools.tools import get_project
+
+        monkeypatch.setattr(client_mod, "RETRY_BACKOFF_BASE", 0.0)
+        unavailable = _mock_response(status_code=503, json_data={"message": "503"})
+        ok = _mock_response(json_data={"id": 1})
+
+        with _patch_client(ok) as mock_cls:
+            mock_cls.return_value.request.side_effect = [unavailable, ok]
+            result = await get_project(project_id="1")
+
+        assert result["id"] == 1
+        assert mock_cls.return_value.request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_503_not_retried_for_post(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Non-idempotent requests should not be replayed on 5xx."""
+        import mcp_gitlab_crunchtools.client as client_mod
+        from mcp_gitlab_crunchtools.errors import GitLabApiError
+        from mcp_gitlab_crunchtools.tools import create_pipeline
+
+        monkeypatch.setattr(client_mod, "RETRY_BACKOFF_BASE", 0.0)
+        resp = _mock_response(status_code=503, json_data={"message": "503"})
+
+        with _patch_client(resp) as mock_cls, pytest.raises(GitLabApiError, match="503"):
+            await create_pipeline(project_id="1")
+
+        assert mock_cls.return_value.request.await_count == 1
+
+
+class TestClientConnection:
+    """Tests for HTTP client connection settings."""
+
+    @pytest.mark.asyncio
+    async def test_client_uses_pooled_http2(self) -> None:
+        """The shared AsyncClient should enable HTTP/2 and raised pool limits."""
+        from mcp_gitlab_crunchtools.client import MAX_CONNECTIONS
+        from mcp_gitlab_crunchtools.tools import get_project
+
+        resp = _mock_response(json_data={"id": 1})
+
+        with _patch_client(resp) as mock_cls:
+            await get_project(project_id="1")
+
+        kwargs = mock_cls.call_args.kwargs
+        assert kwargs["http2"] is True
+        assert kwargs["limits"].max_connections == MAX_CONNECTIONS
+
+    @pytest.mark.asyncio
+    async def test_warmup_logs_instead_of_raising(self) -> None:
+        """warmup should hit /version and swallow API errors."""
+        from mcp_gitlab_crunchtools.client import get_client
+
+        resp = _mock_response(status_code=401, json_data={"message": "401 Unauthorized"})
+
+        with _patch_client(resp) as mock_cls:
+            await get_client().warmup()
+
+        assert mock_cls.return_value.request.call_args.kwargs["url"] == "/version"
+
+    def test_run_falls_back_to_asyncio(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without uvloop installed, the server should run on asyncio's loop."""
+        import sys
+
+        from mcp_gitlab_crunchtools import _run
+
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+        ran: list[bool] = []
+
+        async def serve() -> None:
+            ran.append(True)
+
+        _run(serve())
+
+        assert ran == [True]
+
+    def test_get_client_per_event_loop(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Each event loop should get its own client, reused within the loop."""
+        import asyncio
+
+        from mcp_gitlab_crunchtools.client import GitLabClient, get_client
+
+        monkeypatch.setenv("GITLAB_TOKEN", "glpat-test")
+
+        async def fetch_twice() -> tuple[GitLabClient, GitLabClient]:
+            return get_client(), get_client()
+
+        first, again = asyncio.run(fetch_twice())
+        other, _ = asyncio.run(fetch_twice())
+
+        assert first is again
+        assert first is not other
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_waits_once_bucket_is_full(self) -> None:
+        """Requests past the burst allowance should wait for the bucket to drain."""
+        import time
+
+        from mcp_gitlab_crunchtools.client import _RateLimiter
+
+        limiter = _RateLimiter(2, 0.1)
+        start = time.monotonic()
+        await limiter.acquire()
+        await limiter.acquire()
+        burst = time.monotonic() - start
+        await limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        assert burst < 0.04
+        assert elapsed >= 0.04
+
+    def test_client_released_with_its_loop(self) -> None:
+        """A finished loop's client should be garbage collected with it."""
+        import asyncio
+        import gc
+
+        import mcp_gitlab_crunchtools.client as client_mod
+        from mcp_gitlab_crunchtools.tools import get_project
+
+        async def call_tool() -> None:
+            await get_project(project_id="1")
+
+        with _patch_client(_mock_response(json_data={"id": 1})):
+            for _ in range(3):
+                asyncio.run(call_tool())
+        gc.collect()
+
+        assert len(client_mod._clients) == 0
+        assert not [obj for obj in gc.get_objects() if isinstance(obj, client_mod.GitLabClient)]
+
+    @pytest.mark.asyncio
+    async def test_lifespan_closes_shared_client(self) -> None:
+        """Server shutdown should close the pooled client for the loop."""
+        from mcp_gitlab_crunchtools.client import get_client
+        from mcp_gitlab_crunchtools.server import _lifespan, mcp
+        from mcp_gitlab_crunchtools.tools import get_project
+
+        resp = _mock_response(json_data={"id": 1})
+
+        with _patch_client(resp) as mock_cls:
+            async with _lifespan(mcp):
+                client = get_client()
+                await get_project(project_id="1")
+            mock_cls.return_value.aclose.assert_awaited_once()
+
+        assert get_client() is not client
+
+    @pytest.mark.asyncio
+    async def test_concurrency_capped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """No more than GITLAB_MAX_CONCURRENCY requests should be in flight."""
+        import asyncio
+
+        from mcp_gitlab_crunchtools.tools import get_issue
+
+        monkeypatch.setenv("GITLAB_MAX_CONCURRENCY", "2")
+        resp = _mock_response(json_data={"iid": 1})
+        in_flight = peak = 0
+
+        async def tracked_response(*_args: object, **_kwargs: object) -> object:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return resp
+
+        with _patch_client(resp) as mock_cls:
+            mock_cls.return_value.request.side_effect = tracked_response
+            await asyncio.gather(*(get_issue(project_id="1", issue_iid=n) for n in range(6)))
+
+        assert mock_cls.return_value.request.await_count == 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_oversized_content_length_rejected_by_hook(self) -> None:
+        """The response hook should reject a declared oversize body."""
+        import httpx
+
+        from mcp_gitlab_crunchtools.client import (
+            MAX_RESPONSE_SIZE,
+            _reject_oversized_response,
+        )
+        from mcp_gitlab_crunchtools.errors import GitLabApiError
+
+        resp = httpx.Response(
+            200,
+            headers={"content-length": str(MAX_RESPONSE_SIZE + 1)},
+            request=httpx.Request("GET", "https://gitlab.com/api/v4/projects"),
+        )
+
+        with pytest.raises(GitLabApiError, match="too large"):
+            await _reject_oversized_response(resp)
+
+    @pytest.mark.asyncio
+    async def test_oversized_chunked_response_rejected(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Bodies without content-length should be cut off once over the limit."""
+        import mcp_gitlab_crunchtools.client as client_mod
+        from mcp_gitlab_crunchtools.errors import GitLabApiError
+        from mcp_gitlab_crunchtools.tools import get_project
+
+        monkeypatch.setattr(client_mod, "MAX_RESPONSE_SIZE", 16)
+        resp = _mock_response(json_data={"description": "x" * 64})
+        del resp.headers["content-length"]
+
+        with _patch_client(resp), pytest.raises(GitLabApiError, match="too large"):
+            await get_project(project_id="1")
+
+
+class TestResponseCache:
+    """Tests for the client response cache, ETag revalidation and coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_get_revalidates_with_etag(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A repeated GET should send If-None-Match and reuse the body on 304."""
+        import mcp_gitlab_crunchtools.client as client_mod
+        from mcp_gitlab_crunchtools.tools import get_project
+
+        monkeypatch.setattr(client_mod, "STABLE_CACHE_TTL", 0.0)
+
+        first = _mock_response(json_data={"id": 1, "name": "cached"}, headers={"etag": 'W/"abc"'})
+        not_modified = _mock_response(status_code=304, text="", content_type="text/plain")
+
+        with _patch_client(first) as mock_cls:
+            mock_cls.return_value.request.side_effect = [first, not_modified]
+            await get_project(project_id="1")
+            result = await get_project(project_id="1")
+
+        second_call = mock_cls.return_value.request.await_args_list[1]
+        assert second_call.kwargs["headers"] == {"If-None-Match": 'W/"abc"'}
+        assert result == {"id": 1, "name": "cached"}
+
+    def test_files_at_commit_sha_cached_long(self) -> None:
+        """Files read at a full commit SHA should outlive branch reads in the cache."""
+        from mcp_gitlab_crunchtools.client import (
+            DEFAULT_CACHE_TTL,
+            IMMUTABLE_CACHE_TTL,
+            _cache_ttl,
+        )
+
+        path = "/projects/1/repository/files/README.md"
+
+        assert _cache_ttl((path, (("ref", "a" * 40),))) == IMMUTABLE_CACHE_TTL
+        assert _cache_ttl((path, (("ref", "main"),))) == DEFAULT_CACHE_TTL
+        assert _cache_ttl((path, (("ref", "abc1234"),))) == DEFAULT_CACHE_TTL
+
+    @pytest.mark.asyncio
+    async def test_large_file_at_commit_sha_not_cached_long(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Only small bodies read at a commit SHA should be kept for a day."""
+        import time
+
+        import mcp_gitlab_crunchtools.client as client_mod
+        from mcp_gitlab_crunchtools.tools import get_file
+
+        monkeypatch.setattr(client_mod, "MAX_IMMUTABLE_BODY_SIZE", 8)
+        resp = _mock_response(json_data={"file_path": "README.md", "content": "aGVsbG8="})
+        sha = "a" * 40
+
+        with _patch_client(resp):
+            await get_file(project_id="1", file_path="README.md", ref=sha)
+            cached = list(client_mod.get_client()._response_cache.values())
+
+        assert len(cached) == 1
+        assert cached[0][2] <= time.monotonic() + client_mod.DEFAULT_CACHE_TTL
+
+    def test_only_single_projects_and_groups_cached_long(self) -> None:
+        """Project and group lists should expire as fast as other collections."""
+        from mcp_gitlab_crunchtools.client import (
+            DEFAULT_CACHE_TTL,
+            STABLE_CACHE_TTL,
+            _cache_ttl,
+        )
+
+        assert _cache_ttl(("/projects/1", ())) == STABLE_CACHE_TTL
+        assert _cache_ttl(("/groups/my-group", ())) == STABLE_CACHE_TTL
+        assert _cache_ttl(("/projects", (("search", "api"),))) == DEFAULT_CACHE_TTL
+        assert _cache_ttl(("/groups", ())) == DEFAULT_CACHE_TTL
+
+    @pytest.mark.asyncio
+    async def test_large_body_not_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Bodies over MAX_CACHED_BODY_SIZE should be fetched again, not held."""
+        import mcp_gitlab_crunchtools.client as client_mod
+        from mcp_gitlab_crunchtools.tools import get_project
+
+        monkeypatch.setattr(client_mod, "MAX_CACHED_BODY_SIZE", 8)
+        resp = _mock_response(json_data={"id": 1, "description": "long enough"})
+
+        with _patch_client(resp) as mock_cls:
+            await get_project(project_id="1")
+            await get_project(project_id="1")
+            stats = client_mod.get_client().cache_stats()
+
+        assert mock_cls.return_value.request.await_count == 2
+        assert stats["entries"] == 0
+        assert stats["bytes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_to_byte_budget(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Least recently used entries should be evicted once the byte budget is hit."""
+        import mcp_gitlab_crunchtools.client as client_mod
+        from mcp_gitlab_crunchtools.tools import get_project
+
+        resp = _mock_response(json_data={"id": 1, "name": "project"})
+        monkeypatch.setattr(client_mod, "RESPONSE_CACHE_BYTES", len(resp.content) + 1)
+
+        with _patch_client(resp):
+            await get_project(project_id="1")
+            await get_project(project_id="2")
+            client = client_mod.get_client()
+            cached_paths = [key[0] for key in client._response_cache]
+            stats = client.cache_stats()
+
+        assert cached_paths == ["/projects/2"]
+        assert stats["bytes"] == len(resp.content)
+
+    @pytest.mark.asyncio
+    async def test_fresh_get_served_from_cache(self) -> None:
+        """A repeated GET within its TTL should not reach GitLab."""
+        from mcp_gitlab_crunchtools.tools import get_project
+
+        resp = _mock_response(json_data={"id": 1, "name": "cached"})
+
+        with _patch_client(resp) as mock_cls:
+            await get_project(project_id="1")
+            result = await get_project(project_id="1")
+
+        assert mock_cls.return_value.request.await_count == 1
+        assert result == {"id": 1, "name": "cached"}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_gets_coalesced(self) -> None:
+        """Identical GETs in flight at the same time should share one request."""
+        import asyncio
+
+        from mcp_gitlab_crunchtools.tools import get_pipeline
+
+        resp = _mock_response(json_data={"id": 7, "status": "running"})
+
+        async def slow_response(*_args: object, **_kwargs: object) -> object:
+            await asyncio.sleep(0.01)
+            return resp
+
+        with _patch_client(resp) as mock_cls:
+            mock_cls.return_value.request.side_effect = slow_response
+            results = await asyncio.gather(
+                *(get_pipeline(project_id="1", pipeline_id=7) for _ in range(3))
+            )
+
+        assert mock_cls.return_value.request.await_count == 1
+        assert all(result["id"] == 7 for result in results)
+
+    @pytest.mark.asyncio
+    async def test_mutation_expires_cached_gets(self) -> None:
+        """A successful write should make cached GETs revalidate."""
+        from mcp_gitlab_crunchtools.tools import create_issue_note, get_issue
+
+        issue = _mock_response(json_data={"iid": 1, "title": "Old"}, headers={"etag": 'W/"v1"'})
+        note = _mock_response(json_data={"id": 7, "body": "Done"})
+        updated = _mock_response(json_data={"iid": 1, "title": "New"}, headers={"etag": 'W/"v2"'})
+
+        with _patch_client(issue) as mock_cls:
+            mock_cls.return_value.request.side_effect = [issue, note, updated]
+            await get_issue(project_id="1", issue_iid=1)
+            await create_issue_note(project_id="1", issue_iid=1, body="Done")
+            result = await get_issue(project_id="1", issue_iid=1)
+
+        last_call = mock_cls.return_value.request.await_args_list[2]
+        assert last_call.kwargs["headers"] == {"If-None-Match": 'W/"v1"'}
+        assert result["title"] == "New"
+
+    @pytest.mark.asyncio
+    async def test_get_cache_stats(self) -> None:
+        """Cache stats should count misses, hits and 304 revalidations."""
+        from mcp_gitlab_crunchtools.tools import get_cache_stats, get_project
+
+        resp = _mock_response(json_data={"id": 1}, headers={"etag": 'W/"v1"'})
+
+        with _patch_client(resp) as mock_cls:
+            await get_project(project_id="1")
+            await get_project(project_id="1")
+            stats = await get_cache_stats()
+
+        assert mock_cls.return_value.request.await_count == 1
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_update_response_serves_read_back(self) -> None:
+        """Reading a record right after updating it should reuse the PUT body."""
+        from mcp_gitlab_crunchtools.tools import get_issue, update_issue
+
+        updated = _mock_response(json_data={"iid": 1, "title": "New"})
+
+        with _patch_client(updated) as mock_cls:
+            await update_issue(project_id="1", issue_iid=1, title="New")
+            result = await get_issue(project_id="1", issue_iid=1)
+
+        assert result["title"] == "New"
+        assert mock_cls.return_value.request.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_update_of_non_record_path_not_seeded(self) -> None:
+        """A PUT whose response is not a GET-able record should leave no cache entry."""
+        from mcp_gitlab_crunchtools.client import get_client
+        from mcp_gitlab_crunchtools.tools import update_label
+
+        resp = _mock_response(json_data={"id": 5, "name": "bug"})
+
+        with _patch_client(resp):
+            await update_label(project_id="1", label_id=5, color="#ff0000")
+            cached_paths = [key[0] for key in get_client()._response_cache]
+
+        assert "/projects/1/labels/5" not in cached_paths
+
+    @pytest.mark.asyncio
+    async def test_inflight_get_does_not_overwrite_update(self) -> None:
+        """GETs in flight across an update should neither cache nor return the older body."""
+        import asyncio
+
+        from mcp_gitlab_crunchtools.tools import get_issue, update_issue
+
+        old = _mock_response(json_data={"iid": 1, "title": "Old"})
+        updated = _mock_response(json_data={"iid": 1, "title": "New"})
+        get_sent = asyncio.Event()
+        release_get = asyncio.Event()
+
+        async def respond(*_args: object, **kwargs: object) -> object:
+            if kwargs["method"] == "GET":
+                get_sent.set()
+                await release_get.wait()
+                return old
+            return updated
+
+        with _patch_client(old) as mock_cls:
+            mock_cls.return_value.request.side_effect = respond
+            stale_read = asyncio.ensure_future(get_issue(project_id="1", issue_iid=1))
+            await get_sent.wait()
+            joined_read = asyncio.ensure_future(get_issue(project_id="1", issue_iid=1))
+            await asyncio.sleep(0)
+            await update_issue(project_id="1", issue_iid=1, title="New")
+            release_get.set()
+            reads = await asyncio.gather(stale_read, joined_read)
+            result = await get_issue(project_id="1", issue_iid=1)
+
+        assert [read["title"] for read in reads] == ["New", "New"]
+        assert result["title"] == "New"
+        assert mock_cls.return_value.request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_after_mutation_does_not_join_older_fetch(self) -> None:
+        """A GET issued after a write must not share a fetch started before it."""
+        import asyncio
+
+        from mcp_gitlab_crunchtools.tools import create_issue, get_project
+
+        old = _mock_response(json_data={"id": 1, "open_issues_count": 0})
+        new = _mock_response(json_data={"id": 1, "open_issues_count": 1})
+        created = _mock_response(status_code=201, json_data={"iid": 1})
+        get_sent = asyncio.Event()
+        release_get = asyncio.Event()
+
+        async def respond(*_args: object, **kwargs: object) -> object:
+            if kwargs["method"] != "GET":
+                return created
+            if not get_sent.is_set():
+                get_sent.set()
+                await release_get.wait()
+                return old
+            return new
+
+        with _patch_client(old) as mock_cls:
+            mock_cls.return_value.request.side_effect = respond
+            stale_read = asyncio.ensure_future(get_project(project_id="1"))
+            await get_sent.wait()
+            await create_issue(project_id="1", title="Bug")
+            fresh = await get_project(project_id="1")
+            release_get.set()
+            stale = await stale_read
+
+        assert fresh["open_issues_count"] == 1
+        assert stale["open_issues_count"] == 1
+
+
+class TestPagination:
+    """Tests for multi-page fetching and list field projection."""
+
+    @pytest.mark.asyncio
+    async def test_get_all_pages_concatenates_pages(self) -> None:
+        """get_all_pages should fetch remaining pages and keep page order."""
+        from mcp_gitlab_crunchtools.client import get_client
+
+        pages = [
+            _mock_response(
+                json_data=[{"id": n}],
+                headers={"x-total-pages": "3", "x-page": str(n)},
+            )
+            for n in (1, 2, 3)
+        ]
+
+        with _patch_client(pages[0]) as mock_cls:
+            mock_cls.return_value.request.side_effect = pages
+            result = await get_client().get_all_pages("/projects")
+
+        assert [item["id"] for item in result["items"]] == [1, 2, 3]
+        assert result["pagination"] == {"total": 3, "total_pages": 3}
+        assert mock_cls.return_value.request.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_get_all_pages_follows_next_page(self) -> None:
+        """get_all_pages should walk x-next-page when the total is omitted."""
+        from mcp_gitlab_crunchtools.client import get_client
+
+        pages = [
+            _mock_response(json_data=[{"id": 1}], headers={"x-next-page": "2"}),
+            _mock_response(json_data=[{"id": 2}], headers={"x-page": "2"}),
+        ]
+
+        with _patch_client(pages[0]) as mock_cls:
+            mock_cls.return_value.request.side_effect = pages
+            result = await get_client().get_all_pages("/projects")
+
+        assert [item["id"] for item in result["items"]] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_get_all_pages_stops_at_max_pages(self) -> None:
+        """get_all_pages should fetch at most max_pages and flag truncation."""
+        from mcp_gitlab_crunchtools.client import get_client
+
+        pages = [
+            _mock_response(json_data=[{"id": n}], headers={"x-total-pages": "9"})
+            for n in (1, 2)
+        ]
+
+        with _patch_client(pages[0]) as mock_cls:
+            mock_cls.return_value.request.side_effect = pages
+            result = await get_client().get_all_pages("/projects", max_pages=2)
+
+        assert mock_cls.return_value.request.await_count == 2
+        assert result["pagination"] == {"total": 2, "total_pages": 9, "truncated": True}
+
+    @pytest.mark.asyncio
+    async def test_list_issues_all_pages(self) -> None:
+        """list_issues with all_pages should request 100 items per page."""
+        from mcp_gitlab_crunchtools.tools import list_issues
+
+        pages = [
+            _mock_response(json_data=[{"iid": n}], headers={"x-total-pages": "2"})
+            for n in (1, 2)
+        ]
+
+        with _patch_client(pages[0]) as mock_cls:
+            mock_cls.return_value.request.side_effect = pages
+            result = await list_issues(project_id="1", all_pages=True)
+
+        params = mock_cls.return_value.request.call_args.kwargs["params"]
+        assert params["per_page"] == 100
+        assert [item["iid"] for item in result["items"]] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_list_projects_fields_projection(self) -> None:
+        """fields should trim items without touching the cached response."""
+        from mcp_gitlab_crunchtools.tools import list_projects
+
+        project = {"id": 1, "name": "p", "avatar_url": "https://example.com/a.png"}
+        resp = _mock_response(json_data=[project], headers={"x-total": "1"})
+
+        with _patch_client(resp):
+            trimmed = await list_projects(fields="id, name")
+            full = await list_projects()
+
+        assert trimmed["items"] == [{"id": 1, "name": "p"}]
+        assert trimmed["pagination"] == {"total": 1}
+        assert full["items"] == [project]
+
 
 class TestFileTools:
     """Tests for file tools with mocked API responses."""
@@ -711,6 +1534,51 @@ class TestFileTools:
         assert result["items"][0]["type"] == "tree"
         assert result["items"][1]["type"] == "blob"
 
+    @pytest.mark.asyncio
+    async def test_list_repository_tree_keyset(self) -> None:
+        """Keyset tree listing should send page_token and surface the next one."""
+        from mcp_gitlab_crunchtools.tools import list_repository_tree
+
+        next_url = (
+            "https://gitlab.com/api/v4/projects/1/repository/tree"
+            "?pagination=keyset&per_page=20&page_token=def"
+        )
+        resp = _mock_response(
+            json_data=[{"id": "abc", "name": "src", "type": "tree", "path": "src"}],
+            headers={"link": f'<{next_url}>; rel="next"'},
+        )
+
+        token = "abc"
+        with _patch_client(resp) as mock_cls:
+            result = await list_repository_tree(project_id="1", page_token=token)
+
+        params = mock_cls.return_value.request.call_args.kwargs["params"]
+        assert params["pagination"] == "keyset"
+        assert params["page_token"] == "abc"
+        assert "page" not in params
+        assert result["pagination"] == {"next_page_token": "def"}
+
+    @pytest.mark.asyncio
+    async def test_list_repository_tree_all_pages(self) -> None:
+        """all_pages should walk a recursive tree with page numbers."""
+        from mcp_gitlab_crunchtools.tools import list_repository_tree
+
+        pages = [
+            _mock_response(json_data=[{"path": f"f{n}"}], headers={"x-total-pages": "2"})
+            for n in (1, 2)
+        ]
+
+        with _patch_client(pages[0]) as mock_cls:
+            mock_cls.return_value.request.side_effect = pages
+            result = await list_repository_tree(
+                project_id="1", recursive=True, keyset=True, all_pages=True
+            )
+
+        params = mock_cls.return_value.request.call_args.kwargs["params"]
+        assert "pagination" not in params
+        assert params["recursive"] == "true"
+        assert [item["path"] for item in result["items"]] == ["f1", "f2"]
+
     @pytest.mark.asyncio
     async def test_get_file(self) -> None:
         """get_file should return file metadata and content."""
@@ -733,6 +1601,36 @@ class TestFileTools:
         assert result["file_name"] == "README.md"
         assert result["content"] == "IyBIZWxsbw=="
 
+    @pytest.mark.asyncio
+    async def test_get_file_raw(self) -> None:
+        """get_file with raw should read the raw endpoint as plain text."""
+        from mcp_gitlab_crunchtools.tools import get_file
+
+        resp = _mock_response(text="# Hello", content_type="text/plain")
+
+        with _patch_client(resp) as mock_cls:
+            result = await get_file(project_id="1", file_path="docs/README.md", raw=True)
+
+        call = mock_cls.return_value.request.call_args.kwargs
+        assert call["url"] == "/projects/1/repository/files/docs%2FREADME.md/raw"
+        assert result == {
+            "file_path": "docs/README.md",
+            "ref": "HEAD",
+            "encoding": "text",
+            "content": "# Hello",
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_file_raw_rejects_binary(self) -> None:
+        """get_file with raw should reject non-text files with a ValidationError."""
+        from mcp_gitlab_crunchtools.errors import ValidationError
+        from mcp_gitlab_crunchtools.tools import get_file
+
+        resp = _mock_response(text="\x89PNG\r\n", content_type="image/png")
+
+        with _patch_client(resp), pytest.raises(ValidationError, match="not plain text"):
+            await get_file(project_id="1", file_path="logo.png", raw=True)
+
     @pytest.mark.asyncio
     async def test_create_file(self) -> None:
         """create_file should POST and return file metadata."""
@@ -1037,6 +1935,18 @@ class TestMilestoneTools:
 
         assert len(result["items"]) == 2
 
+    @pytest.mark.asyncio
+    async def test_list_milestones_all_omits_state(self) -> None:
+        """state="all" should send no state filter to GitLab."""
+        from mcp_gitlab_crunchtools.tools import list_milestones
+
+        resp = _mock_response(json_data=[])
+
+        with _patch_client(resp) as mock_cls:
+            await list_milestones(project_id="1", state="all")
+
+        assert "state" not in mock_cls.return_value.request.call_args.kwargs["params"]
+
     @pytest.mark.asyncio
     async def test_create_milestone(self) -> None:
         """create_milestone should POST and return milestone."""
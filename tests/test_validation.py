@@ -60,6 +60,18 @@ class TestProjectIdEncoding:
         with pytest.raises(ValueError, match="alphanumeric"):
             encode_project_id("group/project$(whoami)")
 
+    def test_repeated_ids_are_cached(self) -> None:
+        """Repeat encodings of the same ID should be served from the cache."""
+        encode_project_id.cache_clear()
+        encode_project_id("group/cached")
+        encode_project_id("group/cached")
+        assert encode_project_id.cache_info().hits == 1
+
+    def test_non_ascii_digits(self) -> None:
+        """Unicode digits should not take the numeric fast path."""
+        with pytest.raises(ValueError, match="alphanumeric"):
+            encode_project_id("\u0661\u0662\u0663")
+
 
 class TestGroupIdEncoding:
     """Tests for group ID validation and encoding."""
@@ -111,7 +123,7 @@ class TestCreateIssueInput:
         )
         assert issue.title == "Fix the bug"
         assert issue.labels == "bug,urgent"
-        assert issue.assignee_ids == [1, 2]
+        assert issue.assignee_ids == (1, 2)
         assert issue.confidential is True
 
     def test_title_too_long(self) -> None:
@@ -190,7 +202,7 @@ class TestCreateMergeRequestInput:
             milestone_id=10,
             remove_source_branch=True,
         )
-        assert mr.reviewer_ids == [2, 3]
+        assert mr.reviewer_ids == (2, 3)
         assert mr.remove_source_branch is True
 
     def test_empty_source_branch(self) -> None:
@@ -211,6 +223,15 @@ class TestCreateMergeRequestInput:
                 title="a" * 501,
             )
 
+    def test_same_source_and_target_branch(self) -> None:
+        """Merging a branch into itself should fail before any API call."""
+        with pytest.raises(ValidationError, match="must differ"):
+            CreateMergeRequestInput(
+                source_branch="main",
+                target_branch="main",
+                title="Test",
+            )
+
 
 class TestUpdateMergeRequestInput:
     """Tests for UpdateMergeRequestInput model."""